@@ -5,10 +5,14 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-load_dotenv()
+# Parse .env once per process tree; child processes inherit the loaded values
+if not os.getenv("_CONFIG_LOADED"):
+    load_dotenv()
+    os.environ["_CONFIG_LOADED"] = "1"
 
 # Paths
-DATA_DIR = Path(os.getenv("DATA_DIR", Path(__file__).parent.parent / "data"))
+_data_dir = os.getenv("DATA_DIR")
+DATA_DIR = Path(_data_dir) if _data_dir else Path(__file__).parent.parent / "data"
 DB_PATH = DATA_DIR / "upwork_jobs.db"
 BROWSER_PROFILE_DIR = DATA_DIR / "browser_profile"
 LOG_DIR = DATA_DIR / "logs"
@@ -17,10 +21,25 @@ LOG_DIR = DATA_DIR / "logs"
 SESSION_MANAGER_HOST = os.getenv("SESSION_MANAGER_HOST", "127.0.0.1")
 SESSION_MANAGER_PORT = int(os.getenv("SESSION_MANAGER_PORT", "8024"))
 SESSION_MANAGER_URL = f"http://{SESSION_MANAGER_HOST}:{SESSION_MANAGER_PORT}"
+# Unix socket the Session Manager also listens on; tool calls use it when
+# present. Empty disables it (always the case on Windows).
+SESSION_MANAGER_SOCKET = os.getenv(
+    "SESSION_MANAGER_SOCKET", "" if os.name == "nt" else str(DATA_DIR / "session_manager.sock")
+)
+# Seconds the MCP server waits for an auto-started Session Manager to listen
+SESSION_MANAGER_STARTUP_TIMEOUT = 30
 
 # Browser
 BROWSER_HEADLESS = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
 BROWSER_TIMEOUT = int(os.getenv("BROWSER_TIMEOUT", "30000"))
+BROWSER_PAGE_POOL_SIZE = max(1, int(os.getenv("BROWSER_PAGE_POOL_SIZE", "3")))
+# Launch with images disabled (applies to login/CAPTCHA pages too)
+BROWSER_BLOCK_RESOURCES = os.getenv("BROWSER_BLOCK_RESOURCES", "true").lower() == "true"
+
+# Logging
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Save the last Best Matches HTML to DATA_DIR for parser debugging
+DEBUG_DUMP_HTML = os.getenv("DEBUG_DUMP_HTML", "false").lower() == "true"
 
 # Scraping
 MAX_CONCURRENT_REQUESTS = 10
@@ -29,8 +48,18 @@ DEFAULT_MAX_JOBS = 20
 CACHE_TTL_SECONDS = 3600  # 1 hour
 
 
+_DIRS_READY = False
+
+
 def ensure_dirs():
-    """Create required data directories if they don't exist."""
+    """Create required data directories if they don't exist.
+
+    Only touches the filesystem on the first call per process.
+    """
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     BROWSER_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
     LOG_DIR.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY = True
@@ -103,6 +103,36 @@ SELECTORS = {
     "search_next_page": '[data-test="pagination-next"]',
 }
 
+# Job tile selectors on list pages, tried in order; the first that matches wins
+JOB_TILE_SELECTORS = (
+    '[data-test="job-tile-list"] > section',  # Current Upwork (2025+): sections inside job-tile-list
+    "article.job-tile",
+    'article[data-test="JobTile"]',
+    'div[data-test="job-tile-list"] article',
+    "section.air3-card-section",  # Current Upwork card style
+    "section.up-card-section",
+    'div[class*="job-tile"]',
+)
+
+# Title link inside a job tile, tried in order
+JOB_TILE_TITLE_SELECTORS = (
+    '[data-test="job-tile-title"] a',
+    '[data-test="UpLink"]',
+    "h2 a",
+    "h3 a",
+    'a[href*="/jobs/"][href*="~"]',  # Matches /jobs/Title_~0ID/ and /jobs/~0ID
+    'a[href*="/details/"][href*="~"]',
+)
+
+# Skill tokens inside a job tile, tried in order; the first non-empty match wins
+JOB_TILE_SKILL_SELECTORS = (
+    'a[data-test="attr-item"]',
+    '[data-test="token-container"] a',
+    ".air3-token",
+    '[data-test="TokenClamp"] .air3-token',
+    'span[class*="skill"]',
+)
+
 # ── Login Selectors ──────────────────────────────────────────────────────────
 
 LOGIN_ERROR_MESSAGES = [
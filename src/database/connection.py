@@ -0,0 +1,115 @@
+"""Process-wide shared aiosqlite connections.
+
+``get_db()`` is the read/write connection that creates the schema.
+``get_read_db()`` is a second, query-only connection, so reads (e.g. the
+status endpoint) don't queue behind a scrape's writes on aiosqlite's
+per-connection worker thread. Under WAL they see the last committed state.
+``read_db()`` checks out one of a small pool of query-only connections, for
+callers (the MCP tools) whose concurrent reads should run in parallel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiosqlite
+
+from ..config import DB_PATH, ensure_dirs
+from .models import configure_connection, initialize_db
+
+_db: aiosqlite.Connection | None = None
+_read_db: aiosqlite.Connection | None = None
+# Query-only connections opened by read_db(), and the idle ones among them
+# (LIFO, so sequential callers keep reusing the same warm connection)
+_pool: list[aiosqlite.Connection] = []
+_idle: asyncio.LifoQueue[aiosqlite.Connection] = asyncio.LifoQueue()
+_opening = 0  # Pool connections currently being opened
+READ_POOL_SIZE = 4
+_lock = asyncio.Lock()
+# The schema only has to be created once per process; a connection reopened
+# after close_db() just needs its PRAGMAs
+_schema_ready = False
+
+
+async def get_db() -> aiosqlite.Connection:
+    """Return the shared connection, opening and initializing it on first use."""
+    global _db, _schema_ready
+    if _db is not None:
+        return _db
+    async with _lock:
+        if _db is None:
+            ensure_dirs()
+            db = await aiosqlite.connect(str(DB_PATH))
+            db.row_factory = aiosqlite.Row
+            if _schema_ready:
+                await configure_connection(db)
+            else:
+                await initialize_db(db)
+                _schema_ready = True
+            _db = db
+    return _db
+
+
+async def get_read_db() -> aiosqlite.Connection:
+    """Return the shared query-only connection, opening it on first use."""
+    global _read_db
+    if _read_db is not None:
+        return _read_db
+    await get_db()  # Schema must exist before a read-only handle can use it
+    async with _lock:
+        if _read_db is None:
+            _read_db = await _open_read_db()
+    return _read_db
+
+
+async def _open_read_db() -> aiosqlite.Connection:
+    """Open a query-only connection; the schema must already exist."""
+    db = await aiosqlite.connect(str(DB_PATH))
+    db.row_factory = aiosqlite.Row
+    await configure_connection(db)
+    await db.execute("PRAGMA query_only=ON")
+    return db
+
+
+@asynccontextmanager
+async def read_db() -> AsyncIterator[aiosqlite.Connection]:
+    """Check out a pooled query-only connection for the duration of the block.
+
+    Connections are opened on demand up to READ_POOL_SIZE; past that,
+    callers wait for one to be returned.
+    """
+    global _opening
+    if _idle.empty() and len(_pool) + _opening < READ_POOL_SIZE:
+        _opening += 1  # Reserve the slot across the awaits below
+        try:
+            await get_db()  # Schema must exist before a read-only handle can use it
+            db = await _open_read_db()
+        finally:
+            _opening -= 1
+        _pool.append(db)
+    else:
+        db = await _idle.get()
+    try:
+        yield db
+    finally:
+        if db in _pool:  # Not closed by close_db() meanwhile
+            _idle.put_nowait(db)
+
+
+async def close_db():
+    """Close the shared connections that are open."""
+    global _db, _read_db
+    async with _lock:
+        while not _idle.empty():
+            _idle.get_nowait()
+        for db in _pool:
+            await db.close()
+        _pool.clear()
+        if _read_db is not None:
+            await _read_db.close()
+            _read_db = None
+        if _db is not None:
+            await _db.close()
+            _db = None
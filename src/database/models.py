@@ -2,8 +2,28 @@
 
 from __future__ import annotations
 
+import sqlite3
+
 import aiosqlite
 
+from ..models.job import posted_timestamp
+
+# Applied on every connection before the schema. WAL lets readers run while a
+# scrape is writing, and NORMAL sync is safe under WAL (no fsync per commit).
+PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Only meaningful for on-disk databases; skipped for ":memory:" connections
+FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+)
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS jobs (
     id TEXT PRIMARY KEY,
@@ -36,6 +56,7 @@ CREATE TABLE IF NOT EXISTS jobs (
     invites_sent INTEGER,
     connects_required INTEGER,
     posted_date TEXT DEFAULT '',
+    posted_at INTEGER,
     source TEXT DEFAULT '',
     search_query TEXT DEFAULT '',
     fetched_at TEXT NOT NULL,
@@ -53,14 +74,138 @@ CREATE TABLE IF NOT EXISTS scrape_sessions (
     status TEXT DEFAULT 'running'
 );
 
-CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+-- Stored analyze_market_requirements results, valid while the jobs version
+-- they were computed at is current
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    key TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    result TEXT NOT NULL
+);
+
+-- Composite indexes matching query_jobs' WHERE source = ? ORDER BY ... LIMIT shapes
+DROP INDEX IF EXISTS idx_jobs_source;
+CREATE INDEX IF NOT EXISTS idx_jobs_source_fetched ON jobs(source, fetched_at DESC);
+DROP INDEX IF EXISTS idx_jobs_source_posted;
+CREATE INDEX IF NOT EXISTS idx_jobs_source_budget ON jobs(source, budget_amount DESC);
 CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs(posted_date);
 CREATE INDEX IF NOT EXISTS idx_jobs_fetched ON jobs(fetched_at);
 CREATE INDEX IF NOT EXISTS idx_jobs_experience ON jobs(experience_level);
+-- Covering index so skill aggregation scans skills only, not whole rows
+CREATE INDEX IF NOT EXISTS idx_jobs_skills ON jobs(skills);
+"""
+
+# Full-text index over jobs used for skill search. External-content table, so
+# triggers keep it in sync with jobs. Created separately because SQLite builds
+# without FTS5 must still get the core schema (query_jobs then uses LIKE).
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, description, skills,
+    content='jobs', content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, description, skills)
+    VALUES (new.rowid, new.title, new.description, new.skills);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description, skills)
+    VALUES ('delete', old.rowid, old.title, old.description, old.skills);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, description, skills ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description, skills)
+    VALUES ('delete', old.rowid, old.title, old.description, old.skills);
+    INSERT INTO jobs_fts(rowid, title, description, skills)
+    VALUES (new.rowid, new.title, new.description, new.skills);
+END;
+"""
+
+
+# Indexes on columns added after the first release; created once the
+# migration has made sure the columns exist.
+MIGRATED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_jobs_posted_at ON jobs(posted_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_source_posted_at ON jobs(source, posted_at DESC);
 """
 
 
+async def _is_file_backed(db: aiosqlite.Connection) -> bool:
+    """Return False for in-memory (and temporary) databases."""
+    async with db.execute("PRAGMA database_list") as cursor:
+        for _, name, filename in await cursor.fetchall():
+            if name == "main":
+                return bool(filename)
+    return False
+
+
+async def _migrate(db: aiosqlite.Connection):
+    """Add columns missing from databases created by older versions.
+
+    Runs in one write transaction so a crash can't leave a column without
+    its backfill, and a second process starting at the same time waits and
+    then sees the column instead of adding it again.
+    """
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        async with db.execute("PRAGMA table_info(jobs)") as cursor:
+            columns = {row[1] for row in await cursor.fetchall()}
+        if "posted_at" not in columns:
+            await db.execute("ALTER TABLE jobs ADD COLUMN posted_at INTEGER")
+
+        # Also picks up rows from a run that died before this was atomic
+        async with db.execute(
+            "SELECT id, posted_date, fetched_at FROM jobs WHERE posted_at IS NULL"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        await db.executemany(
+            "UPDATE jobs SET posted_at = ? WHERE id = ?",
+            [(posted_timestamp(posted or "", fetched or ""), job_id) for job_id, posted, fetched in rows],
+        )
+    except BaseException:
+        await db.rollback()
+        raise
+    await db.commit()
+
+    await db.executescript(MIGRATED_INDEXES)
+
+
+async def _initialize_fts(db: aiosqlite.Connection):
+    """Create the FTS index, backfilling it from jobs on first creation."""
+    async with db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+    ) as cursor:
+        exists = await cursor.fetchone() is not None
+    try:
+        await db.executescript(FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        return  # No FTS5 in this SQLite build
+    if not exists:
+        await db.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+
+async def configure_connection(db: aiosqlite.Connection):
+    """Apply the per-connection PRAGMAs."""
+    if await _is_file_backed(db):
+        for pragma in FILE_PRAGMAS:
+            await db.execute(pragma)
+    for pragma in PRAGMAS:
+        await db.execute(pragma)
+
+
 async def initialize_db(db: aiosqlite.Connection):
-    """Create tables and indexes if they don't exist."""
+    """Configure the connection and create tables and indexes if they don't exist."""
+    await configure_connection(db)
     await db.executescript(SCHEMA)
+    await _migrate(db)
+    await _initialize_fts(db)
+    # Analyze only tables whose statistics are missing or stale, rather than
+    # a full ANALYZE on every process start
+    await db.execute("PRAGMA optimize=0x10002")
     await db.commit()
+
+
+async def run_maintenance(db: aiosqlite.Connection):
+    """Bound WAL growth and refresh planner statistics on a long-lived connection."""
+    await db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+    await db.execute("PRAGMA optimize")
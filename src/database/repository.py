@@ -2,93 +2,297 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import sqlite3
 import sys
+import time
 from collections import Counter
-from datetime import datetime, timedelta
 from typing import Optional
 
 import aiosqlite
+import orjson
 
-from ..models.job import Job, JobSummary
+from ..config import LOG_LEVEL
+from ..models.job import Job, JobSummary, posted_timestamp
 
 logger = logging.getLogger(__name__)
 if not logger.handlers:
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s"))
     logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
+
+
+_SQL_UPSERT = """
+    INSERT INTO jobs (
+        id, url, title, description, budget_type, budget_amount,
+        hourly_rate_min, hourly_rate_max, currency, experience_level,
+        duration, weekly_hours, skills, category, subcategory,
+        client_country, client_city, client_rating, client_total_spent,
+        client_hires, client_active_jobs, client_jobs_posted,
+        client_company_size, client_member_since, payment_verified,
+        proposals_count, interviewing_count, invites_sent,
+        connects_required, posted_date, source, search_query,
+        fetched_at, raw_html, posted_at
+    ) VALUES (
+        :id, :url, :title, :description, :budget_type, :budget_amount,
+        :hourly_rate_min, :hourly_rate_max, :currency, :experience_level,
+        :duration, :weekly_hours, :skills, :category, :subcategory,
+        :client_country, :client_city, :client_rating, :client_total_spent,
+        :client_hires, :client_active_jobs, :client_jobs_posted,
+        :client_company_size, :client_member_since, :payment_verified,
+        :proposals_count, :interviewing_count, :invites_sent,
+        :connects_required, :posted_date, :source, :search_query,
+        :fetched_at, :raw_html, :posted_at
+    )
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title,
+        description = CASE WHEN length(excluded.description) > length(jobs.description) THEN excluded.description ELSE jobs.description END,
+        budget_type = COALESCE(NULLIF(excluded.budget_type, ''), jobs.budget_type),
+        budget_amount = COALESCE(excluded.budget_amount, jobs.budget_amount),
+        hourly_rate_min = COALESCE(excluded.hourly_rate_min, jobs.hourly_rate_min),
+        hourly_rate_max = COALESCE(excluded.hourly_rate_max, jobs.hourly_rate_max),
+        experience_level = COALESCE(NULLIF(excluded.experience_level, ''), jobs.experience_level),
+        skills = CASE WHEN length(excluded.skills) > 2 THEN excluded.skills ELSE jobs.skills END,
+        client_rating = COALESCE(excluded.client_rating, jobs.client_rating),
+        client_total_spent = COALESCE(excluded.client_total_spent, jobs.client_total_spent),
+        client_hires = COALESCE(excluded.client_hires, jobs.client_hires),
+        proposals_count = COALESCE(excluded.proposals_count, jobs.proposals_count),
+        fetched_at = excluded.fetched_at,
+        posted_at = COALESCE(jobs.posted_at, excluded.posted_at),
+        raw_html = CASE WHEN length(excluded.raw_html) > length(jobs.raw_html) THEN excluded.raw_html ELSE jobs.raw_html END
+    """
+
+# Skill frequencies computed inside SQLite via JSON1; rows with malformed
+# skills JSON are skipped rather than aborting the whole aggregation.
+_SQL_SKILL_COUNTS = """
+    SELECT value, COUNT(*) FROM jobs, json_each(jobs.skills)
+    WHERE json_valid(jobs.skills) AND value != ''
+    GROUP BY value
+    ORDER BY COUNT(*) DESC, value
+    LIMIT ?
+    """
+
+# Scalar statistics for get_stats, gathered in one scan.
+_SQL_STATS_AGG = """
+    SELECT
+        COUNT(*),
+        COUNT(CASE WHEN source = 'best_matches' THEN 1 END),
+        COUNT(CASE WHEN source = 'search' THEN 1 END),
+        MAX(fetched_at),
+        AVG(CASE WHEN budget_amount > 0 THEN budget_amount END)
+    FROM jobs
+    """
+
+# Market aggregates over the rows of a query_jobs statement ({jobs}), so they
+# cover exactly the jobs the listing would return. The budget bucket counts
+# are appended by _market_agg_sql.
+_SQL_MARKET_AGG = """
+    WITH sel AS ({jobs})
+    SELECT
+        COUNT(*),
+        COUNT(CASE WHEN hourly_rate_min THEN 1 END),
+        COUNT(CASE WHEN hourly_rate_min THEN NULL WHEN budget_amount THEN 1 END),
+        AVG(CASE WHEN hourly_rate_min > 0 THEN hourly_rate_min END),
+        AVG(CASE WHEN hourly_rate_max > 0 THEN hourly_rate_max END),
+        AVG(CASE WHEN budget_amount > 0 THEN budget_amount END){buckets}
+    FROM sel
+    """
+_SQL_MARKET_EXPERIENCE = """
+    WITH sel AS ({jobs})
+    SELECT experience_level, COUNT(*) FROM sel
+    WHERE experience_level != ''
+    GROUP BY experience_level
+    ORDER BY COUNT(*) DESC, experience_level
+    """
+_SQL_MARKET_SKILLS = """
+    WITH sel AS ({jobs})
+    SELECT value, COUNT(*) FROM sel, json_each(sel.skills)
+    WHERE json_valid(sel.skills) AND value != ''
+    GROUP BY value
+    ORDER BY COUNT(*) DESC, value
+    LIMIT ?
+    """
+_SQL_MARKET_SKILL_JSON = "WITH sel AS ({jobs}) SELECT skills FROM sel"
+
+_SQL_JOBS_VERSION = "SELECT COUNT(*), MAX(fetched_at) FROM jobs"
+_SQL_GET_ANALYSIS = "SELECT result FROM analysis_cache WHERE key = ? AND version = ?"
+_SQL_STORE_ANALYSIS = "INSERT OR REPLACE INTO analysis_cache (key, version, result) VALUES (?, ?, ?)"
+_SQL_PRUNE_ANALYSIS = "DELETE FROM analysis_cache WHERE version != ?"
+
+_SQL_GET_JOB = "SELECT * FROM jobs WHERE id = ?"
+_SQL_COUNT = "SELECT COUNT(*) FROM jobs"
+_SQL_EXPERIENCE_BREAKDOWN = (
+    "SELECT experience_level, COUNT(*) FROM jobs "
+    "WHERE experience_level != '' GROUP BY experience_level"
+)
+_SQL_ALL_SKILLS = "SELECT skills FROM jobs"
+
+# Rows fetched per round trip when scanning the whole table
+_FETCH_BATCH = 1000
+
+# Columns JobSummary needs, in model field order; query_jobs selects only these
+# instead of SELECT * so description/raw_html never leave SQLite.
+_SUMMARY_COLUMNS = tuple(JobSummary.model_fields)
+_SQL_SUMMARY_SELECT = f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM jobs"
+
+_SORT_ORDERS = {
+    "posted_date": "posted_at DESC",
+    "fetched_at": "fetched_at DESC",
+    "budget": "budget_amount DESC",  # NULLs sort last; matches idx_jobs_source_budget
+}
+
+
+def _fts_skills_query(skills: list[str]) -> str:
+    """Build an FTS5 MATCH expression matching ANY of the skills as a prefix.
+
+    The tokenizer drops punctuation ("c++" matches like "c*"), so this only
+    narrows the candidates; the LIKE terms still decide the exact match.
+    """
+    terms = " OR ".join('"{}"*'.format(s.replace('"', '""')) for s in skills)
+    return f"skills : ({terms})"
+
+
+def _fts_unavailable(error: sqlite3.OperationalError) -> bool:
+    """Whether ``error`` means FTS5 or the jobs_fts table is missing.
+
+    Anything else (e.g. "database is locked") is transient and must not
+    switch skill search over to LIKE for the rest of the process.
+    """
+    message = str(error)
+    return "no such module: fts5" in message or "no such table: jobs_fts" in message
+
+
+def _build_query_sql(
+    source: bool,
+    fts: bool,
+    like_skills: int,
+    min_budget: bool,
+    experience: bool,
+    posted_within: bool,
+    sort_by: str,
+) -> str:
+    """Build the query_jobs SQL for one combination of active filters."""
+    conditions = []
+    if source:
+        conditions.append("source = ?")
+    if fts:
+        conditions.append("rowid IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+    if like_skills:
+        conditions.append(f"({' OR '.join(['LOWER(skills) LIKE ?'] * like_skills)})")
+    if min_budget:
+        conditions.append("(budget_amount >= ? OR hourly_rate_min >= ?)")
+    if experience:
+        conditions.append("LOWER(experience_level) LIKE ?")
+    if posted_within:
+        conditions.append("posted_at >= ?")
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"{_SQL_SUMMARY_SELECT} {where} ORDER BY {_SORT_ORDERS[sort_by]} LIMIT ?"
+
+
+def _market_agg_sql(jobs_sql: str, budget_edges: tuple[float, ...]) -> str:
+    """Build the market aggregate SQL, counting positive budgets per bucket."""
+    bounds = [0, *budget_edges, None]
+    buckets = []
+    for low, high in zip(bounds, bounds[1:]):
+        cond = f"budget_amount > {low}" if low == 0 else f"budget_amount >= {float(low)!r}"
+        if high is not None:
+            cond += f" AND budget_amount < {float(high)!r}"
+        buckets.append(f",\n        COUNT(CASE WHEN {cond} THEN 1 END)")
+    return _SQL_MARKET_AGG.format(jobs=jobs_sql, buckets="".join(buckets))
+
+
+def _decode_skills(value: Optional[str]) -> list[str]:
+    """Decode the stored skills JSON, treating bad or empty values as no skills."""
+    if not value:
+        return []
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return []
+
+
+def _job_to_row(job: Job) -> dict:
+    """Build the named parameters for _SQL_UPSERT.
+
+    sqlite3 binds bools as 0/1, so only skills needs encoding; posted_at
+    is derived from posted_date for time-range filtering.
+    """
+    row = job.model_dump()
+    row["skills"] = job.skills_json
+    row["posted_at"] = posted_timestamp(job.posted_date, job.fetched_at)
+    return row
 
 
 class JobRepository:
     """Async repository for job data in SQLite."""
 
+    # Cleared once jobs_fts turns out to be missing so later calls skip the prefilter
+    _use_fts = True
+
     def __init__(self, db: aiosqlite.Connection):
         self._db = db
+        # query_jobs SQL keyed by filter shape, so identical shapes reuse the
+        # exact same string and hit sqlite3's prepared-statement cache
+        self._query_sql: dict[tuple, str] = {}
 
-    async def upsert_job(self, job: Job):
-        """Insert or update a job in the database."""
-        await self._db.execute(
-            """
-            INSERT INTO jobs (
-                id, url, title, description, budget_type, budget_amount,
-                hourly_rate_min, hourly_rate_max, currency, experience_level,
-                duration, weekly_hours, skills, category, subcategory,
-                client_country, client_city, client_rating, client_total_spent,
-                client_hires, client_active_jobs, client_jobs_posted,
-                client_company_size, client_member_since, payment_verified,
-                proposals_count, interviewing_count, invites_sent,
-                connects_required, posted_date, source, search_query,
-                fetched_at, raw_html
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-            ON CONFLICT(id) DO UPDATE SET
-                title = excluded.title,
-                description = CASE WHEN length(excluded.description) > length(jobs.description) THEN excluded.description ELSE jobs.description END,
-                budget_type = COALESCE(NULLIF(excluded.budget_type, ''), jobs.budget_type),
-                budget_amount = COALESCE(excluded.budget_amount, jobs.budget_amount),
-                hourly_rate_min = COALESCE(excluded.hourly_rate_min, jobs.hourly_rate_min),
-                hourly_rate_max = COALESCE(excluded.hourly_rate_max, jobs.hourly_rate_max),
-                experience_level = COALESCE(NULLIF(excluded.experience_level, ''), jobs.experience_level),
-                skills = CASE WHEN length(excluded.skills) > 2 THEN excluded.skills ELSE jobs.skills END,
-                client_rating = COALESCE(excluded.client_rating, jobs.client_rating),
-                client_total_spent = COALESCE(excluded.client_total_spent, jobs.client_total_spent),
-                client_hires = COALESCE(excluded.client_hires, jobs.client_hires),
-                proposals_count = COALESCE(excluded.proposals_count, jobs.proposals_count),
-                fetched_at = excluded.fetched_at,
-                raw_html = CASE WHEN length(excluded.raw_html) > length(jobs.raw_html) THEN excluded.raw_html ELSE jobs.raw_html END
-            """,
-            (
-                job.id, job.url, job.title, job.description, job.budget_type,
-                job.budget_amount, job.hourly_rate_min, job.hourly_rate_max,
-                job.currency, job.experience_level, job.duration, job.weekly_hours,
-                json.dumps(job.skills), job.category, job.subcategory,
-                job.client_country, job.client_city, job.client_rating,
-                job.client_total_spent, job.client_hires, job.client_active_jobs,
-                job.client_jobs_posted, job.client_company_size, job.client_member_since,
-                1 if job.payment_verified else 0,
-                job.proposals_count, job.interviewing_count, job.invites_sent,
-                job.connects_required, job.posted_date, job.source, job.search_query,
-                job.fetched_at, job.raw_html,
-            ),
-        )
-        await self._db.commit()
+    async def upsert_job(self, job: Job, commit: bool = True):
+        """Insert or update a job in the database.
+
+        Pass commit=False to batch several upserts into one transaction.
+        """
+        await self._db.execute(_SQL_UPSERT, _job_to_row(job))
+        if commit:
+            await self._db.commit()
 
     async def upsert_jobs(self, jobs: list[Job]):
-        """Insert or update multiple jobs."""
-        for job in jobs:
-            await self.upsert_job(job)
+        """Insert or update multiple jobs in a single transaction."""
+        if not jobs:
+            return
+        rows = [_job_to_row(job) for job in jobs]
+        # Take the write lock up front (waiting out busy_timeout if needed)
+        # rather than failing on a read-to-write upgrade mid-batch
+        if not self._db.in_transaction:
+            await self._db.execute("BEGIN IMMEDIATE")
+        try:
+            await self._db.executemany(_SQL_UPSERT, rows)
+        except BaseException:
+            await self._db.rollback()
+            raise
+        await self._db.commit()
+
+    async def jobs_version(self) -> str:
+        """Return a value that changes whenever the stored jobs change.
+
+        Every upsert stamps a new fetched_at, and jobs are never deleted, so
+        the row count plus the newest fetched_at moves on each write from
+        any process. Both come from indexes.
+        """
+        ((count, last_fetch),) = await self._db.execute_fetchall(_SQL_JOBS_VERSION)
+        return f"{count}:{last_fetch or ''}"
+
+    async def get_cached_analysis(self, key: str, version: str) -> Optional[str]:
+        """Return a stored analysis result if it was computed at ``version``."""
+        rows = await self._db.execute_fetchall(_SQL_GET_ANALYSIS, (key, version))
+        return rows[0][0] if rows else None
+
+    async def store_analysis(self, key: str, version: str, result: str):
+        """Store an analysis result, dropping any computed at older versions."""
+        if not self._db.in_transaction:
+            await self._db.execute("BEGIN IMMEDIATE")
+        try:
+            await self._db.execute(_SQL_PRUNE_ANALYSIS, (version,))
+            await self._db.execute(_SQL_STORE_ANALYSIS, (key, version, result))
+        except BaseException:
+            await self._db.rollback()
+            raise
+        await self._db.commit()
 
     async def get_job(self, job_id: str) -> Optional[Job]:
         """Get a single job by ID."""
-        async with self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                return self._row_to_job(row, cursor.description)
-        return None
+        rows = await self._db.execute_fetchall(_SQL_GET_JOB, (job_id,))
+        return self._row_to_job(rows[0]) if rows else None
 
     async def query_jobs(
         self,
@@ -101,132 +305,194 @@ class JobRepository:
         limit: int = 25,
     ) -> list[JobSummary]:
         """Query jobs with filters. Returns summaries for efficiency."""
-        conditions = []
-        params = []
+        query, params, use_fts = self._filtered_query(
+            source, skills_contain, min_budget, experience_level,
+            posted_within_hours, sort_by, limit,
+        )
+        try:
+            rows = await self._db.execute_fetchall(query, params)
+        except sqlite3.OperationalError as e:
+            if not use_fts or not _fts_unavailable(e):
+                raise
+            # jobs_fts is missing (SQLite without FTS5): retry with LIKE matching
+            logger.warning("FTS skill search unavailable, falling back to LIKE")
+            JobRepository._use_fts = False
+            return await self.query_jobs(
+                source, skills_contain, min_budget, experience_level,
+                posted_within_hours, sort_by, limit,
+            )
+        return [self._row_to_summary(row) for row in rows]
+
+    def _filtered_query(
+        self,
+        source: str = "",
+        skills_contain: str = "",
+        min_budget: int = 0,
+        experience_level: str = "",
+        posted_within_hours: int = 0,
+        sort_by: str = "fetched_at",
+        limit: int = 25,
+    ) -> tuple[str, list, bool]:
+        """Build the query_jobs SQL and parameters for these filters.
 
+        Returns ``(sql, params, use_fts)``; ``use_fts`` tells the caller
+        whether a failure may just mean FTS5 is unavailable.
+        """
+        params = []
         if source:
-            conditions.append("source = ?")
             params.append(source)
 
-        if skills_contain:
-            skill_list = [s.strip().lower() for s in skills_contain.split(",")]
-            skill_conditions = ["LOWER(skills) LIKE ?" for _ in skill_list]
-            conditions.append(f"({' OR '.join(skill_conditions)})")
-            params.extend([f"%{s}%" for s in skill_list])
+        skill_list = [s.strip().lower() for s in skills_contain.split(",") if s.strip()]
+        # A skill with no word characters ("++") has no FTS tokens to prefilter on
+        use_fts = (
+            bool(skill_list)
+            and self._use_fts
+            and all(any(c.isalnum() for c in s) for s in skill_list)
+        )
+        if use_fts:
+            params.append(_fts_skills_query(skill_list))
+        params.extend([f"%{s}%" for s in skill_list])
 
         if min_budget > 0:
-            conditions.append("(budget_amount >= ? OR hourly_rate_min >= ?)")
             params.extend([min_budget, min_budget])
 
         if experience_level:
-            conditions.append("LOWER(experience_level) LIKE ?")
             params.append(f"%{experience_level.lower()}%")
 
         if posted_within_hours > 0:
-            cutoff = (datetime.utcnow() - timedelta(hours=posted_within_hours)).isoformat()
-            conditions.append("fetched_at >= ?")
-            params.append(cutoff)
+            params.append(int(time.time()) - posted_within_hours * 3600)
+
+        params.append(limit)
 
-        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        key = (
+            bool(source), use_fts, len(skill_list),
+            min_budget > 0, bool(experience_level), posted_within_hours > 0,
+            sort_by if sort_by in _SORT_ORDERS else "fetched_at",
+        )
+        query = self._query_sql.get(key)
+        if query is None:
+            query = self._query_sql[key] = _build_query_sql(*key)
+        return query, params, use_fts
 
-        sort_map = {
-            "posted_date": "posted_date DESC",
-            "fetched_at": "fetched_at DESC",
-            "budget": "COALESCE(budget_amount, 0) DESC",
+    async def aggregate_market(
+        self,
+        skills_contain: str = "",
+        top_n: int = 20,
+        budget_edges: tuple[float, ...] = (),
+        limit: int = 500,
+    ) -> dict:
+        """Aggregate market statistics over the newest matching jobs in SQL.
+
+        Covers the same jobs as ``query_jobs(skills_contain=..., limit=...)``
+        but only the aggregates cross the worker thread, not the rows.
+        Positive fixed budgets are counted into ``len(budget_edges) + 1``
+        buckets split at the (ascending) edges.
+        """
+        query, params, use_fts = self._filtered_query(skills_contain=skills_contain, limit=limit)
+        try:
+            (row,) = await self._db.execute_fetchall(_market_agg_sql(query, budget_edges), params)
+        except sqlite3.OperationalError as e:
+            if not use_fts or not _fts_unavailable(e):
+                raise
+            logger.warning("FTS skill search unavailable, falling back to LIKE")
+            JobRepository._use_fts = False
+            return await self.aggregate_market(skills_contain, top_n, budget_edges, limit)
+
+        total, hourly, fixed, avg_min, avg_max, avg_budget, *buckets = row
+        result = {
+            "total": total,
+            "hourly_count": hourly,
+            "fixed_count": fixed,
+            "avg_hourly_rate_min": avg_min or 0,
+            "avg_hourly_rate_max": avg_max or 0,
+            "avg_fixed_budget": avg_budget or 0,
+            "budget_buckets": buckets,
+            "experience_breakdown": {},
+            "top_skills": [],
         }
-        order = sort_map.get(sort_by, "fetched_at DESC")
+        if not total:
+            return result
 
-        query = f"SELECT * FROM jobs {where} ORDER BY {order} LIMIT ?"
-        params.append(limit)
+        rows = await self._db.execute_fetchall(_SQL_MARKET_EXPERIENCE.format(jobs=query), params)
+        result["experience_breakdown"] = {row[0]: row[1] for row in rows}
 
-        async with self._db.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            return [
-                JobSummary.from_job(self._row_to_job(row, cursor.description))
-                for row in rows
-            ]
+        try:
+            rows = await self._db.execute_fetchall(
+                _SQL_MARKET_SKILLS.format(jobs=query), [*params, top_n]
+            )
+            result["top_skills"] = [(row[0], row[1]) for row in rows]
+        except sqlite3.OperationalError as e:
+            # SQLite builds without JSON1 lack json_each(); count in Python.
+            logger.warning("JSON1 skill aggregation unavailable (%s), falling back", e)
+            counter = Counter()
+            for (skills,) in await self._db.execute_fetchall(
+                _SQL_MARKET_SKILL_JSON.format(jobs=query), params
+            ):
+                counter.update(filter(None, _decode_skills(skills)))
+            result["top_skills"] = counter.most_common(top_n)
+        return result
 
     async def get_stats(self) -> dict:
         """Get aggregate statistics about cached jobs."""
-        stats = {}
-
-        async with self._db.execute("SELECT COUNT(*) FROM jobs") as cursor:
-            stats["total_jobs"] = (await cursor.fetchone())[0]
-
-        async with self._db.execute(
-            "SELECT COUNT(*) FROM jobs WHERE source = 'best_matches'"
-        ) as cursor:
-            stats["best_matches_count"] = (await cursor.fetchone())[0]
-
-        async with self._db.execute(
-            "SELECT COUNT(*) FROM jobs WHERE source = 'search'"
-        ) as cursor:
-            stats["search_count"] = (await cursor.fetchone())[0]
-
-        async with self._db.execute("SELECT MAX(fetched_at) FROM jobs") as cursor:
-            row = await cursor.fetchone()
-            stats["last_fetch_time"] = row[0] if row[0] else None
-
-        # Top skills
-        async with self._db.execute("SELECT skills FROM jobs") as cursor:
-            all_skills = Counter()
-            async for row in cursor:
-                try:
-                    skills = json.loads(row[0]) if row[0] else []
-                    for s in skills:
-                        if s:
-                            all_skills[s] += 1
-                except json.JSONDecodeError:
-                    continue
-            stats["top_skills"] = dict(all_skills.most_common(20))
-
-        # Average budget
-        async with self._db.execute(
-            "SELECT AVG(budget_amount) FROM jobs WHERE budget_amount > 0"
-        ) as cursor:
-            row = await cursor.fetchone()
-            stats["avg_budget"] = round(row[0], 2) if row[0] else 0
+        # execute_fetchall runs execute + fetch + close in one worker-thread hop
+        ((total, best_matches, search, last_fetch, avg_budget),) = await self._db.execute_fetchall(
+            _SQL_STATS_AGG
+        )
+
+        stats = {
+            "total_jobs": total,
+            "best_matches_count": best_matches,
+            "search_count": search,
+            "last_fetch_time": last_fetch or None,
+            "top_skills": dict(await self.get_skill_counts(20)),
+            "avg_budget": round(avg_budget, 2) if avg_budget else 0,
+        }
 
         # Experience level breakdown
-        async with self._db.execute(
-            "SELECT experience_level, COUNT(*) FROM jobs WHERE experience_level != '' GROUP BY experience_level"
-        ) as cursor:
-            stats["experience_breakdown"] = {row[0]: row[1] async for row in cursor}
+        rows = await self._db.execute_fetchall(_SQL_EXPERIENCE_BREAKDOWN)
+        stats["experience_breakdown"] = {row[0]: row[1] for row in rows}
 
         return stats
 
     async def get_skill_counts(self, limit: int = 30) -> list[tuple[str, int]]:
         """Get skill frequency counts across all jobs."""
-        async with self._db.execute("SELECT skills FROM jobs") as cursor:
-            counter = Counter()
-            async for row in cursor:
-                try:
-                    skills = json.loads(row[0]) if row[0] else []
-                    for s in skills:
-                        if s:
-                            counter[s] += 1
-                except json.JSONDecodeError:
-                    continue
+        try:
+            rows = await self._db.execute_fetchall(_SQL_SKILL_COUNTS, (limit,))
+            return [(row[0], row[1]) for row in rows]
+        except sqlite3.OperationalError as e:
+            # SQLite builds without JSON1 lack json_each(); count in Python.
+            logger.warning("JSON1 skill aggregation unavailable (%s), falling back", e)
+            return await self._count_skills_in_python(limit)
+
+    async def _count_skills_in_python(self, limit: int) -> list[tuple[str, int]]:
+        """Fallback skill counter that decodes each row's skills JSON."""
+        counter = Counter()
+        async with self._db.execute(_SQL_ALL_SKILLS) as cursor:
+            # One worker-thread round trip per batch instead of per 64 rows
+            cursor.arraysize = _FETCH_BATCH
+            while rows := await cursor.fetchmany():
+                for row in rows:
+                    counter.update(filter(None, _decode_skills(row[0])))
         return counter.most_common(limit)
 
     async def get_job_count(self) -> int:
         """Get total number of cached jobs."""
-        async with self._db.execute("SELECT COUNT(*) FROM jobs") as cursor:
-            return (await cursor.fetchone())[0]
-
-    def _row_to_job(self, row: tuple, description) -> Job:
-        """Convert a database row to a Job model."""
-        col_names = [d[0] for d in description]
-        data = dict(zip(col_names, row))
-
-        # Parse JSON fields
-        if isinstance(data.get("skills"), str):
-            try:
-                data["skills"] = json.loads(data["skills"])
-            except json.JSONDecodeError:
-                data["skills"] = []
-
-        # Convert integer boolean
-        data["payment_verified"] = bool(data.get("payment_verified", 0))
-
-        return Job(**data)
+        ((count,),) = await self._db.execute_fetchall(_SQL_COUNT)
+        return count
+
+    def _row_to_summary(self, row: tuple) -> JobSummary:
+        """Convert a _SUMMARY_COLUMNS row to a JobSummary.
+
+        Uses model_construct: rows come from our own schema, so Pydantic
+        validation would only re-check what SQLite already stores.
+        """
+        data = dict(zip(_SUMMARY_COLUMNS, row))
+        data["skills"] = _decode_skills(data["skills"])
+        return JobSummary.model_construct(**data)
+
+    def _row_to_job(self, row: aiosqlite.Row) -> Job:
+        """Convert a database row to a Job model, skipping validation."""
+        data = dict(row)
+        data["skills"] = _decode_skills(data["skills"])
+        data["payment_verified"] = bool(data["payment_verified"])
+        return Job.model_construct(**data)
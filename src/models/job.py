@@ -2,10 +2,68 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, field_validator
+
+from ..constants import (
+    CATEGORIES,
+    EXPERIENCE_LEVELS,
+    JOB_TYPES,
+    PROJECT_DURATIONS,
+    SORT_OPTIONS,
+    WORKLOAD_OPTIONS,
+)
+
+
+_UNIT_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 7 * 86400,
+    "month": 30 * 86400,
+    "year": 365 * 86400,
+}
+_RELATIVE_RE = re.compile(
+    r"(\d+|an?|one|last)\s+(second|minute|hour|day|week|month|year)s?(?:\s+ago)?"
+)
+
+
+def _parse_iso(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp, treating naive values as UTC."""
+    try:
+        dt = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def posted_timestamp(posted_date: str, fetched_at: str) -> Optional[int]:
+    """Resolve a job's posting time to a unix timestamp.
+
+    Handles ISO dates and Upwork's relative strings ("Posted 3 hours ago",
+    "yesterday"), which are anchored at fetched_at. Falls back to fetched_at
+    when posted_date can't be parsed.
+    """
+    fetched = _parse_iso(fetched_at) if fetched_at else None
+    text = posted_date.strip().lower()
+    if text:
+        posted = _parse_iso(posted_date)
+        if posted:
+            return int(posted.timestamp())
+        if fetched:
+            match = _RELATIVE_RE.search(text)
+            if match:
+                count = int(match[1]) if match[1].isdigit() else 1
+                return int((fetched - timedelta(seconds=count * _UNIT_SECONDS[match[2]])).timestamp())
+            if "yesterday" in text:
+                return int((fetched - timedelta(days=1)).timestamp())
+    return int(fetched.timestamp()) if fetched else None
 
 
 class Job(BaseModel):
@@ -61,6 +119,28 @@ class Job(BaseModel):
     )
     raw_html: str = ""
 
+    @field_validator(
+        "budget_amount", "hourly_rate_min", "hourly_rate_max",
+        "client_rating", "client_total_spent", "client_hires",
+        "client_active_jobs", "client_jobs_posted", "proposals_count",
+        "interviewing_count", "invites_sent", "connects_required",
+        mode="before",
+    )
+    @classmethod
+    def _blank_to_none(cls, value):
+        """Store empty or non-numeric scraped strings as NULL, not TEXT."""
+        if isinstance(value, str):
+            try:
+                float(value)
+            except ValueError:
+                return None
+        return value
+
+    @property
+    def skills_json(self) -> str:
+        """Skills encoded as the JSON array stored in the database."""
+        return orjson.dumps(self.skills).decode()
+
 
 class JobSummary(BaseModel):
     """Lightweight job summary for list responses."""
@@ -107,66 +187,83 @@ class SearchParams(BaseModel):
 
     def to_url_params(self) -> dict[str, str]:
         """Convert search params to Upwork URL query parameters."""
-        from ..constants import (
-            CATEGORIES,
-            EXPERIENCE_LEVELS,
-            JOB_TYPES,
-            PROJECT_DURATIONS,
-            SORT_OPTIONS,
-            WORKLOAD_OPTIONS,
-        )
-
-        params: dict[str, str] = {}
-
-        if self.query:
-            params["q"] = self.query
-        if self.sort_by and self.sort_by in SORT_OPTIONS:
-            params["sort"] = SORT_OPTIONS[self.sort_by]
-        if self.max_results:
-            params["per_page"] = str(min(self.max_results, 50))
-        if self.page > 1:
-            params["page"] = str(self.page)
-
-        # Job type
-        if self.job_type and self.job_type in JOB_TYPES:
-            params["t"] = JOB_TYPES[self.job_type]
-
-        # Experience level
-        if self.experience_level:
-            levels = [
-                EXPERIENCE_LEVELS[l.strip()]
-                for l in self.experience_level.split(",")
-                if l.strip() in EXPERIENCE_LEVELS
-            ]
-            if levels:
-                params["contractor_tier"] = ",".join(levels)
-
-        # Budget
-        if self.budget_min or self.budget_max:
-            low = str(self.budget_min) if self.budget_min else ""
-            high = str(self.budget_max) if self.budget_max else ""
-            params["amount"] = f"{low}-{high}"
-
-        # Hourly rate
-        if self.hourly_rate_min or self.hourly_rate_max:
-            low = str(self.hourly_rate_min) if self.hourly_rate_min else ""
-            high = str(self.hourly_rate_max) if self.hourly_rate_max else ""
-            params["hourly_rate"] = f"{low}-{high}"
-
-        # Category
-        if self.category and self.category in CATEGORIES:
-            params["category2_uid"] = CATEGORIES[self.category]
-
-        # Client hires
-        if self.client_hires:
-            params["client_hires"] = self.client_hires
-
-        # Project length
-        if self.project_length and self.project_length in PROJECT_DURATIONS:
-            params["duration_v3"] = PROJECT_DURATIONS[self.project_length]
-
-        # Hours per week
-        if self.hours_per_week and self.hours_per_week in WORKLOAD_OPTIONS:
-            params["workload"] = WORKLOAD_OPTIONS[self.hours_per_week]
-
-        return params
+        return dict(_url_params(**vars(self)))
+
+
+@lru_cache(maxsize=128)
+def _url_params(
+    query: str,
+    category: str,
+    experience_level: str,
+    job_type: str,
+    budget_min: int,
+    budget_max: int,
+    hourly_rate_min: int,
+    hourly_rate_max: int,
+    client_hires: str,
+    proposals: str,
+    hours_per_week: str,
+    project_length: str,
+    sort_by: str,
+    max_results: int,
+    page: int,
+) -> tuple[tuple[str, str], ...]:
+    """Build URL parameters for a SearchParams field set.
+
+    Cached because the same searches are typically repeated; returns
+    items rather than a dict so cached results can't be mutated.
+    """
+    params: dict[str, str] = {}
+
+    if query:
+        params["q"] = query
+    if sort_by and sort_by in SORT_OPTIONS:
+        params["sort"] = SORT_OPTIONS[sort_by]
+    if max_results:
+        params["per_page"] = str(min(max_results, 50))
+    if page > 1:
+        params["page"] = str(page)
+
+    # Job type
+    if job_type and job_type in JOB_TYPES:
+        params["t"] = JOB_TYPES[job_type]
+
+    # Experience level
+    if experience_level:
+        levels = [
+            EXPERIENCE_LEVELS[l.strip()]
+            for l in experience_level.split(",")
+            if l.strip() in EXPERIENCE_LEVELS
+        ]
+        if levels:
+            params["contractor_tier"] = ",".join(levels)
+
+    # Budget
+    if budget_min or budget_max:
+        low = str(budget_min) if budget_min else ""
+        high = str(budget_max) if budget_max else ""
+        params["amount"] = f"{low}-{high}"
+
+    # Hourly rate
+    if hourly_rate_min or hourly_rate_max:
+        low = str(hourly_rate_min) if hourly_rate_min else ""
+        high = str(hourly_rate_max) if hourly_rate_max else ""
+        params["hourly_rate"] = f"{low}-{high}"
+
+    # Category
+    if category and category in CATEGORIES:
+        params["category2_uid"] = CATEGORIES[category]
+
+    # Client hires
+    if client_hires:
+        params["client_hires"] = client_hires
+
+    # Project length
+    if project_length and project_length in PROJECT_DURATIONS:
+        params["duration_v3"] = PROJECT_DURATIONS[project_length]
+
+    # Hours per week
+    if hours_per_week and hours_per_week in WORKLOAD_OPTIONS:
+        params["workload"] = WORKLOAD_OPTIONS[hours_per_week]
+
+    return tuple(params.items())
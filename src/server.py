@@ -1,74 +1,132 @@
 """MCP Server entry point for the Upwork Job Scraper plugin.
 
-Exposes 11 tools to Claude Code via the Model Context Protocol:
+Exposes 12 tools to Claude Code via the Model Context Protocol:
 - Session management: start_session, session_status, check_auth, stop_session
-- Scraping: fetch_best_matches, search_jobs, get_job_details
+- Scraping: fetch_best_matches, search_jobs, get_job_details,
+  fetch_job_details_batch
 - Query: list_cached_jobs, get_scraping_stats
 - Analysis: analyze_market_requirements, suggest_portfolio_projects
 
 The Session Manager HTTP service (aiohttp on localhost:8024) is auto-started
-as part of the MCP server lifecycle — no separate process needed.
+as a child process for the lifetime of the MCP server.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
+from pathlib import Path
 
-from aiohttp.web import AppRunner, TCPSite
 from mcp.server.fastmcp import FastMCP
 
-from .config import SESSION_MANAGER_HOST, SESSION_MANAGER_PORT, ensure_dirs
+from .config import (
+    LOG_LEVEL,
+    SESSION_MANAGER_HOST,
+    SESSION_MANAGER_PORT,
+    SESSION_MANAGER_STARTUP_TIMEOUT,
+)
+from .database.connection import close_db
 from .tools.analysis_tools import analyze_market_requirements, suggest_portfolio_projects
 from .tools.query_tools import get_scraping_stats, list_cached_jobs
-from .tools.scraping_tools import fetch_best_matches, get_job_details, search_jobs
-from .tools.session_tools import check_auth, session_status, start_session, stop_session
+from .tools.scraping_tools import (
+    fetch_best_matches,
+    fetch_job_details_batch,
+    get_job_details,
+    search_jobs,
+)
+from .tools.session_tools import (
+    check_auth,
+    close_client,
+    session_status,
+    start_session,
+    stop_session,
+)
 
 # Configure logging to stderr (stdout is reserved for MCP JSON-RPC)
 logging.basicConfig(
     stream=sys.stderr,
-    level=logging.INFO,
+    level=LOG_LEVEL,
     format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
 )
 logger = logging.getLogger("upwork-scraper")
 
-# Ensure data directories exist
-ensure_dirs()
+# Working directory for the Session Manager child (`python -m src.session_manager`)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
 # ── Lifespan: auto-start Session Manager ─────────────────────────────────────
 
 
-@asynccontextmanager
-async def lifespan(server: FastMCP):
-    """Start the Session Manager HTTP service alongside the MCP server."""
-    from .session_manager.manager import create_app
-
-    app = create_app()
-    runner = AppRunner(app)
-    await runner.setup()
-    site = TCPSite(runner, SESSION_MANAGER_HOST, SESSION_MANAGER_PORT)
-    managed = False
+async def _session_manager_listening() -> bool:
+    """Return True if something accepts connections on the Session Manager port."""
     try:
-        await site.start()
-        logger.info(
-            "Session Manager auto-started on %s:%s", SESSION_MANAGER_HOST, SESSION_MANAGER_PORT
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(SESSION_MANAGER_HOST, SESSION_MANAGER_PORT), timeout=1.0
         )
-        managed = True
-    except OSError:
-        # Port already in use — assume Session Manager was started manually
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    await writer.wait_closed()
+    return True
+
+
+async def _stop_process(proc: asyncio.subprocess.Process):
+    """Terminate the Session Manager, killing it if it doesn't exit in time."""
+    if proc.returncode is not None:
+        return
+    proc.terminate()
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=15)
+    except asyncio.TimeoutError:
+        logger.warning("Session Manager did not exit in time, killing it")
+        proc.kill()
+        await proc.wait()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Start the Session Manager HTTP service alongside the MCP server.
+
+    It runs as a child process so browser automation and HTML parsing never
+    block the MCP event loop's stdio handling.
+    """
+    proc = None
+    if await _session_manager_listening():
         logger.info(
             "Session Manager already running on %s:%s", SESSION_MANAGER_HOST, SESSION_MANAGER_PORT
         )
-        await runner.cleanup()
+    else:
+        # stdout belongs to MCP JSON-RPC; the child logs to the inherited stderr
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "src.session_manager",
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            cwd=PROJECT_ROOT,
+        )
+        deadline = asyncio.get_running_loop().time() + SESSION_MANAGER_STARTUP_TIMEOUT
+        while proc.returncode is None and asyncio.get_running_loop().time() < deadline:
+            if await _session_manager_listening():
+                logger.info(
+                    "Session Manager auto-started on %s:%s (pid %s)",
+                    SESSION_MANAGER_HOST, SESSION_MANAGER_PORT, proc.pid,
+                )
+                break
+            await asyncio.sleep(0.1)
+        else:
+            logger.warning(
+                "Session Manager not ready after startup (exit code %s)", proc.returncode
+            )
 
     try:
         yield {}
     finally:
-        if managed:
-            await runner.cleanup()
+        if proc:
+            await _stop_process(proc)
             logger.info("Session Manager stopped.")
+        await close_client()
+        await close_db()
 
 
 # ── MCP Server ───────────────────────────────────────────────────────────────
@@ -105,28 +163,31 @@ async def tool_start_session(headless: bool = False) -> str:
     return await start_session(headless)
 
 
-@mcp.tool()
-async def tool_session_status() -> str:
-    """Check if the Upwork session is active.
+# Zero-argument tools are registered straight onto their implementations;
+# a wrapper would only add a frame and an await per call.
+mcp.add_tool(
+    session_status,
+    name="tool_session_status",
+    description="""Check if the Upwork session is active.
 
     Returns: session state, cookie count, cached jobs, last scrape time.
-    """
-    return await session_status()
-
+    """,
+)
 
-@mcp.tool()
-async def tool_check_auth() -> str:
-    """Verify authentication after user completes login.
+mcp.add_tool(
+    check_auth,
+    name="tool_check_auth",
+    description="""Verify authentication after user completes login.
 
     Call this after the user says they've logged in and solved CAPTCHAs.
-    """
-    return await check_auth()
-
+    """,
+)
 
-@mcp.tool()
-async def tool_stop_session() -> str:
-    """Stop the browser session. Saves cookies, cached data remains available."""
-    return await stop_session()
+mcp.add_tool(
+    stop_session,
+    name="tool_stop_session",
+    description="Stop the browser session. Saves cookies, cached data remains available.",
+)
 
 
 # ── Scraping Tools ───────────────────────────────────────────────────────────
@@ -198,6 +259,19 @@ async def tool_get_job_details(job_url: str) -> str:
     return await get_job_details(job_url)
 
 
+@mcp.tool()
+async def tool_fetch_job_details_batch(job_urls: list[str]) -> str:
+    """Get complete details for several Upwork jobs in one call.
+
+    Faster than repeated get_job_details calls: one browser tab visits
+    every job in turn. Failed URLs are reported under "errors".
+
+    Args:
+        job_urls: Full Upwork URLs or job IDs (~0xxxxx), at most 20.
+    """
+    return await fetch_job_details_batch(job_urls)
+
+
 # ── Query Tools (instant, from local cache) ──────────────────────────────────
 
 
@@ -230,13 +304,14 @@ async def tool_list_cached_jobs(
     )
 
 
-@mcp.tool()
-async def tool_get_scraping_stats() -> str:
-    """Get statistics about the cached job database.
+mcp.add_tool(
+    get_scraping_stats,
+    name="tool_get_scraping_stats",
+    description="""Get statistics about the cached job database.
 
     Returns: total jobs, top skills, avg budget, experience breakdown.
-    """
-    return await get_scraping_stats()
+    """,
+)
 
 
 # ── Analysis Tools ───────────────────────────────────────────────────────────
@@ -2,4 +2,6 @@
 
 from .manager import main
 
-main()
+# Guarded so parser worker processes started with "spawn" don't rerun the server
+if __name__ == "__main__":
+    main()
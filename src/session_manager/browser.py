@@ -5,27 +5,80 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 from camoufox.async_api import AsyncCamoufox
-from playwright.async_api import BrowserContext, Page
-
-from ..config import BROWSER_HEADLESS, BROWSER_PROFILE_DIR, BROWSER_TIMEOUT
+from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
+
+from ..config import (
+    BROWSER_BLOCK_RESOURCES,
+    BROWSER_HEADLESS,
+    BROWSER_PAGE_POOL_SIZE,
+    BROWSER_PROFILE_DIR,
+    BROWSER_TIMEOUT,
+    LOG_LEVEL,
+)
 from ..constants import (
+    JOB_TILE_SELECTORS,
     LOGIN_ERROR_MESSAGES,
     SELECTORS,
     UPWORK_BASE,
     UPWORK_BEST_MATCHES_URL,
     UPWORK_LOGIN_URL,
 )
-from .captcha import detect_login_page, handle_captcha
+from .captcha import detect_login_page, handle_captcha, track_navigation
 
 logger = logging.getLogger(__name__)
 if not logger.handlers:
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s"))
     logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
+
+
+# Scroll-until-stable loop run entirely in the page: one CDP round trip for
+# the whole scroll instead of three per step. After each scroll it waits for
+# DOM mutations to go quiet for 300ms (capped at 1.5s, the old fixed sleep).
+# With minTiles > 0 it also stops once that many job tiles are on the page,
+# counted with the parser's selectors (first selector that matches wins).
+_SCROLL_JS = """async ([maxScrolls, minTiles, tileSelectors]) => {
+    const settle = () => new Promise((resolve) => {
+        let quiet;
+        const done = () => { observer.disconnect(); clearTimeout(quiet); clearTimeout(cap); resolve(); };
+        const observer = new MutationObserver(() => {
+            clearTimeout(quiet);
+            quiet = setTimeout(done, 300);
+        });
+        const cap = setTimeout(done, 1500);
+        observer.observe(document.body, {subtree: true, childList: true});
+    });
+    const enoughTiles = () => {
+        if (!minTiles) return false;
+        for (const selector of tileSelectors) {
+            const count = document.querySelectorAll(selector).length;
+            if (count) return count >= minTiles;
+        }
+        return false;
+    };
+    let scrolls = 0;
+    while (scrolls < maxScrolls) {
+        if (enoughTiles()) {
+            return {scrolls, height: document.body.scrollHeight, reachedEnd: false, enoughTiles: true};
+        }
+        const prevHeight = document.body.scrollHeight;
+        window.scrollTo(0, prevHeight);
+        await settle();
+        scrolls++;
+        if (document.body.scrollHeight === prevHeight) {
+            return {scrolls, height: prevHeight, reachedEnd: true, enoughTiles: false};
+        }
+    }
+    return {scrolls, height: document.body.scrollHeight, reachedEnd: false, enoughTiles: false};
+}"""
+
+# Upper bound on the network-idle wait before scrolling (the old fixed sleep)
+_NETWORK_IDLE_TIMEOUT_MS = 1500
 
 
 class BrowserSession:
@@ -36,7 +89,10 @@ class BrowserSession:
         self._browser = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        # Pages (incl. _page) handed out to concurrent scrapes once authenticated
+        self._page_pool: Optional[asyncio.Queue[Page]] = None
         self._cookies: list[dict] = []
+        self._cookie_map: Optional[dict[str, str]] = None
         self._user_agent: str = ""
         self._is_authenticated: bool = False
 
@@ -52,6 +108,23 @@ class BrowserSession:
     def cookies(self) -> list[dict]:
         return self._cookies
 
+    @property
+    def cookie_map(self) -> dict[str, str]:
+        """Cookies as a name -> value dict, built once per cookie refresh.
+
+        Shared as-is with HTTP scrapers, so treat it as read-only.
+        """
+        if self._cookie_map is None:
+            self._cookie_map = {
+                c["name"]: c["value"] for c in self._cookies if "name" in c and "value" in c
+            }
+        return self._cookie_map
+
+    def _set_cookies(self, cookies: list[dict]):
+        """Replace the captured cookies and drop the derived cookie_map."""
+        self._cookies = cookies
+        self._cookie_map = None
+
     @property
     def user_agent(self) -> str:
         return self._user_agent
@@ -69,7 +142,7 @@ class BrowserSession:
         use_headless = headless if headless is not None else BROWSER_HEADLESS
 
         try:
-            logger.info(f"Launching Camoufox (headless={use_headless})...")
+            logger.info("Launching Camoufox (headless=%s)...", use_headless)
 
             self._camoufox = AsyncCamoufox(
                 headless=use_headless,
@@ -78,6 +151,12 @@ class BrowserSession:
                 i_know_what_im_doing=True,
                 config={"forceScopeAccess": True},
                 disable_coop=True,
+                # Images are blocked by the browser itself: a Playwright route
+                # would disable the HTTP cache and send every request through
+                # Python. The cache lets Upwork's JS/CSS bundles be reused
+                # across feed and detail navigations.
+                block_images=BROWSER_BLOCK_RESOURCES,
+                enable_cache=True,
             )
             self._browser = await self._camoufox.__aenter__()
 
@@ -88,6 +167,7 @@ class BrowserSession:
             )
             self._page = await self._context.new_page()
             self._page.set_default_timeout(BROWSER_TIMEOUT)
+            track_navigation(self._page)
 
             # Try to load Upwork and check if we have a valid session
             logger.info("Navigating to Upwork Best Matches...")
@@ -98,7 +178,7 @@ class BrowserSession:
                     timeout=BROWSER_TIMEOUT,
                 )
             except Exception as e:
-                logger.warning(f"Navigation timeout, trying with longer wait: {e}")
+                logger.warning("Navigation timeout, trying with longer wait: %s", e)
                 await self._page.goto(
                     UPWORK_BEST_MATCHES_URL,
                     wait_until="commit",
@@ -106,12 +186,7 @@ class BrowserSession:
                 )
 
             # Log where we actually ended up (catches silent redirects)
-            logger.info(f"[DEBUG] After navigation, URL: {self._page.url}")
-            try:
-                title = await self._page.title()
-                logger.info(f"[DEBUG] Page title: '{title}'")
-            except Exception:
-                logger.warning("[DEBUG] Could not read page title")
+            await self._log_location(self._page, "After navigation")
 
             # Handle potential CAPTCHA
             captcha_result = await handle_captcha(self._page)
@@ -123,7 +198,7 @@ class BrowserSession:
 
             # Check if redirected to login
             if await detect_login_page(self._page):
-                logger.info(f"No valid session, login required. Current URL: {self._page.url}")
+                logger.info("No valid session, login required. Current URL: %s", self._page.url)
                 return {
                     "state": "needs_login",
                     "message": "Browser is open. Please log in to Upwork in the browser window and tell me when done.",
@@ -132,11 +207,12 @@ class BrowserSession:
             # Session is valid
             await self._extract_session_data()
             self._is_authenticated = True
+            await self._fill_page_pool()
             logger.info("Session restored successfully.")
             return {"state": "active", "message": "Session active with saved cookies."}
 
         except Exception as e:
-            logger.error(f"Failed to start browser: {e}")
+            logger.error("Failed to start browser: %s", e)
             await self.stop()
             return {"state": "error", "message": f"Failed to start browser: {e}"}
 
@@ -171,95 +247,174 @@ class BrowserSession:
             if UPWORK_BASE in current_url and "/login" not in current_url:
                 await self._extract_session_data()
                 self._is_authenticated = True
+                await self._fill_page_pool()
                 logger.info("Authentication confirmed.")
                 return {"state": "active", "message": "Successfully authenticated."}
 
             return {"state": "needs_login", "message": "Authentication not confirmed."}
 
         except Exception as e:
-            logger.error(f"Error checking auth: {e}")
+            logger.error("Error checking auth: %s", e)
             return {"state": "error", "message": f"Error checking auth: {e}"}
 
+    async def _log_location(self, page: Page, label: str):
+        """Debug-log the current URL and title.
+
+        Reading the title is a CDP round trip, so it only happens when
+        debug logging is enabled.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("%s, URL: %s", label, page.url)
+        try:
+            logger.debug("Page title: '%s'", await page.title())
+        except Exception:
+            logger.debug("Could not read page title")
+
     async def _extract_session_data(self):
         """Extract cookies and user-agent from the browser context."""
         try:
-            self._cookies = await self._context.cookies()
+            self._set_cookies(await self._context.cookies())
             self._user_agent = await self._page.evaluate("() => navigator.userAgent")
             logger.info(
-                f"Extracted {len(self._cookies)} cookies, "
-                f"UA: {self._user_agent[:60]}..."
+                "Extracted %d cookies, UA: %.60s...", len(self._cookies), self._user_agent
             )
         except Exception as e:
-            logger.warning(f"Failed to extract session data: {e}")
+            logger.warning("Failed to extract session data: %s", e)
             self._user_agent = (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/131.0.0.0 Safari/537.36"
             )
 
-    async def get_page_html(self, url: str, wait_selector: str = "body") -> str:
+    async def _fill_page_pool(self):
+        """Open the extra scrape pages once the session is authenticated."""
+        if self._page_pool is not None:
+            return
+        pool: asyncio.Queue[Page] = asyncio.Queue()
+        pool.put_nowait(self._page)
+        try:
+            for _ in range(BROWSER_PAGE_POOL_SIZE - 1):
+                page = await self._context.new_page()
+                page.set_default_timeout(BROWSER_TIMEOUT)
+                track_navigation(page)
+                pool.put_nowait(page)
+            # Keep the main tab in front for any login/CAPTCHA the user must do
+            await self._page.bring_to_front()
+        except Exception as e:
+            logger.warning("Could not open extra scrape pages: %s", e)
+        self._page_pool = pool
+        logger.info("Page pool ready with %d page(s).", pool.qsize())
+
+    @asynccontextmanager
+    async def acquire_page(self) -> AsyncIterator[Page]:
+        """Check out a page for one scrape, waiting if all pages are busy.
+
+        Before authentication there is no pool and the main page is used.
+        """
+        if not self.is_running:
+            raise RuntimeError("Browser is not running.")
+        pool = self._page_pool
+        if pool is None:
+            yield self._page
+            return
+        page = await pool.get()
+        try:
+            yield page
+        finally:
+            pool.put_nowait(page)
+
+    async def get_page_html(
+        self, url: str, wait_selector: str = "body", page: Optional[Page] = None
+    ) -> str:
         """Navigate to a URL and return the page HTML.
 
         Used for pages that need browser rendering (Best Matches, etc.).
+        Uses the main page unless a pooled page is passed in.
         """
         if not self.is_running:
             raise RuntimeError("Browser is not running.")
+        page = page or self._page
 
-        logger.info(f"[DEBUG] get_page_html: navigating to {url}")
-        try:
-            await self._page.goto(url, wait_until="domcontentloaded", timeout=BROWSER_TIMEOUT)
-        except Exception:
-            logger.warning("[DEBUG] domcontentloaded timed out, retrying with commit...")
-            await self._page.goto(url, wait_until="commit", timeout=BROWSER_TIMEOUT * 2)
+        await self._navigate(page, url, wait_selector)
+        html = await page.content()
+        logger.debug("get_page_html: got %d chars of HTML", len(html))
+        return html
+
+    async def navigate_and_scroll(
+        self, url: str, max_scrolls: int = 10, page: Optional[Page] = None, stop_at_tiles: int = 0
+    ) -> str:
+        """Navigate to a job feed, scroll it, and return the final HTML.
+
+        Serializes the DOM once, after scrolling, instead of once per step.
+        """
+        if not self.is_running:
+            raise RuntimeError("Browser is not running.")
+        page = page or self._page
+
+        await self._navigate(page, url)
+        return await self.scroll_and_collect(max_scrolls, page=page, stop_at_tiles=stop_at_tiles)
+
+    async def _navigate(self, page: Page, url: str, wait_selector: str = "body"):
+        """Load a URL, clear any CAPTCHA and wait for content to appear.
 
-        logger.info(f"[DEBUG] Landed on URL: {self._page.url}")
+        Raises RuntimeError if the CAPTCHA can't be solved or the session expired.
+        """
+        logger.debug("Navigating to %s", url)
         try:
-            title = await self._page.title()
-            logger.info(f"[DEBUG] Page title: '{title}'")
+            await page.goto(url, wait_until="domcontentloaded", timeout=BROWSER_TIMEOUT)
         except Exception:
-            pass
+            logger.warning("domcontentloaded timed out, retrying with commit...")
+            await page.goto(url, wait_until="commit", timeout=BROWSER_TIMEOUT * 2)
+
+        await self._log_location(page, "Landed")
 
         # Handle CAPTCHA if it appears
-        captcha_result = await handle_captcha(self._page)
+        captcha_result = await handle_captcha(page)
         if not captcha_result["resolved"]:
             raise RuntimeError(captcha_result["message"])
 
         # Check for login redirect
-        if await detect_login_page(self._page):
+        if await detect_login_page(page):
             self._is_authenticated = False
             raise RuntimeError("Session expired. Please re-authenticate.")
 
         # Wait for content
         try:
-            await self._page.wait_for_selector(wait_selector, timeout=10000)
+            await page.wait_for_selector(wait_selector, timeout=10000)
         except Exception:
-            logger.warning(f"[DEBUG] Selector '{wait_selector}' not found within 10s, proceeding anyway")
-
-        html = await self._page.content()
-        logger.info(f"[DEBUG] get_page_html: got {len(html)} chars of HTML")
-        return html
+            logger.warning("Selector '%s' not found within 10s, proceeding anyway", wait_selector)
 
-    async def scroll_and_collect(self, max_scrolls: int = 10) -> str:
+    async def scroll_and_collect(
+        self, max_scrolls: int = 10, page: Optional[Page] = None, stop_at_tiles: int = 0
+    ) -> str:
         """Scroll the current page to load dynamic content (Best Matches).
 
+        Stops early once ``stop_at_tiles`` job tiles are loaded (0 = no limit).
         Returns the full page HTML after scrolling.
         """
         if not self.is_running:
             raise RuntimeError("Browser is not running.")
+        page = page or self._page
 
-        logger.info(f"[DEBUG] scroll_and_collect: starting (max_scrolls={max_scrolls})")
-        for i in range(max_scrolls):
-            prev_height = await self._page.evaluate("document.body.scrollHeight")
-            await self._page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(1.5)  # Wait for content to load
-            new_height = await self._page.evaluate("document.body.scrollHeight")
-            logger.info(f"[DEBUG] Scroll {i + 1}: height {prev_height} -> {new_height}")
-            if new_height == prev_height:
-                logger.info(f"Reached end of content after {i + 1} scrolls.")
-                break
-
-        html = await self._page.content()
-        logger.info(f"[DEBUG] scroll_and_collect: final HTML size = {len(html)} chars")
+        logger.debug("scroll_and_collect: starting (max_scrolls=%d)", max_scrolls)
+        # Let the initial job-feed XHRs land so the first scroll measures the
+        # real page height; returns early on fast networks
+        try:
+            await page.wait_for_load_state("networkidle", timeout=_NETWORK_IDLE_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
+        result = await page.evaluate(
+            _SCROLL_JS, [max_scrolls, stop_at_tiles, list(JOB_TILE_SELECTORS)]
+        )
+        logger.debug("Scrolled %d times, final height %d", result["scrolls"], result["height"])
+        if result["reachedEnd"]:
+            logger.info("Reached end of content after %d scrolls.", result["scrolls"])
+        elif result["enoughTiles"]:
+            logger.info("Loaded %d+ job tiles after %d scrolls.", stop_at_tiles, result["scrolls"])
+
+        html = await page.content()
+        logger.debug("scroll_and_collect: final HTML size = %d chars", len(html))
         return html
 
     async def stop(self):
@@ -271,21 +426,22 @@ class BrowserSession:
             if self._context:
                 # Extract final cookies before closing
                 try:
-                    self._cookies = await self._context.cookies()
+                    self._set_cookies(await self._context.cookies())
                 except Exception:
                     pass
                 await self._context.close()
         except Exception as e:
-            logger.warning(f"Error closing context: {e}")
+            logger.warning("Error closing context: %s", e)
         finally:
             self._context = None
             self._page = None
+            self._page_pool = None
 
         try:
             if self._camoufox:
                 await self._camoufox.__aexit__(None, None, None)
         except Exception as e:
-            logger.warning(f"Error closing camoufox: {e}")
+            logger.warning("Error closing camoufox: %s", e)
         finally:
             self._camoufox = None
             self._browser = None
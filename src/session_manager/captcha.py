@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import sys
+from weakref import WeakKeyDictionary
 
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
+from ..config import LOG_LEVEL
 from ..constants import CLOUDFLARE_INDICATORS
 
 logger = logging.getLogger(__name__)
@@ -16,14 +19,29 @@ if not logger.handlers:
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s"))
     logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
+
+
+# Runs in the page so only a boolean crosses the CDP pipe, not the whole DOM.
+# Checks the serialized markup because some indicators are class names and
+# script URLs rather than visible text. All indicators are folded into one
+# regex alternation so the markup is scanned once instead of once per string.
+_CF_PATTERN = "|".join(re.escape(indicator) for indicator in CLOUDFLARE_INDICATORS)
+_CF_PROBE_JS = """(pattern) => {
+    const html = document.documentElement ? document.documentElement.outerHTML : '';
+    return new RegExp(pattern).test(html);
+}"""
+
+
+# How often the resolution wait re-runs the probe. Playwright's default is
+# every animation frame, which would re-serialize the DOM ~60 times a second.
+_CF_POLL_MS = 250
 
 
 async def detect_cloudflare(page: Page) -> bool:
     """Check if the current page shows a Cloudflare challenge."""
     try:
-        content = await page.content()
-        return any(indicator in content for indicator in CLOUDFLARE_INDICATORS)
+        return await page.evaluate(_CF_PROBE_JS, _CF_PATTERN)
     except Exception:
         return False
 
@@ -34,13 +52,25 @@ async def wait_for_cloudflare_resolution(page: Page, timeout_ms: int = 30000) ->
     Returns True if resolved, False if timed out.
     """
     logger.info("Cloudflare challenge detected, waiting for auto-resolution...")
-    deadline = asyncio.get_event_loop().time() + (timeout_ms / 1000)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (timeout_ms / 1000)
 
-    while asyncio.get_event_loop().time() < deadline:
-        if not await detect_cloudflare(page):
-            logger.info("Cloudflare challenge resolved automatically.")
-            return True
-        await asyncio.sleep(2)
+    while (remaining := deadline - loop.time()) > 0:
+        try:
+            await page.wait_for_function(
+                f"(pattern) => !({_CF_PROBE_JS})(pattern)",
+                arg=_CF_PATTERN,
+                polling=_CF_POLL_MS,
+                timeout=remaining * 1000,
+            )
+        except PlaywrightTimeoutError:
+            break
+        except Exception:
+            # The challenge page navigating away can tear down the wait; re-arm
+            await asyncio.sleep(0.5)
+            continue
+        logger.info("Cloudflare challenge resolved automatically.")
+        return True
 
     logger.warning("Cloudflare challenge did not auto-resolve within timeout.")
     return False
@@ -52,27 +82,56 @@ async def detect_login_page(page: Page) -> bool:
     return "/login" in url or "/account-security" in url
 
 
+_CAPTCHA_CHECKS = (
+    ("iframe[src*='hcaptcha']", "hcaptcha"),
+    ("iframe[src*='recaptcha']", "recaptcha"),
+    ("#cf-turnstile", "cloudflare_turnstile"),
+    (".cf-challenge", "cloudflare_challenge"),
+    ("[data-testid='challenge']", "upwork_challenge"),
+)
+
+# All selectors checked in one round trip; first hit in _CAPTCHA_CHECKS order wins
+_CAPTCHA_PROBE_JS = """(checks) => {
+    for (const [selector, captchaType] of checks) {
+        if (document.querySelector(selector)) return captchaType;
+    }
+    return null;
+}"""
+
+
 async def detect_captcha_element(page: Page) -> str | None:
     """Detect specific CAPTCHA elements on the page.
 
     Returns the type of CAPTCHA found, or None.
     """
-    checks = [
-        ("iframe[src*='hcaptcha']", "hcaptcha"),
-        ("iframe[src*='recaptcha']", "recaptcha"),
-        ("#cf-turnstile", "cloudflare_turnstile"),
-        (".cf-challenge", "cloudflare_challenge"),
-        ("[data-testid='challenge']", "upwork_challenge"),
-    ]
-    for selector, captcha_type in checks:
-        try:
-            element = await page.query_selector(selector)
-            if element:
-                logger.info(f"Detected CAPTCHA type: {captcha_type}")
-                return captcha_type
-        except Exception:
-            continue
-    return None
+    try:
+        captcha_type = await page.evaluate(_CAPTCHA_PROBE_JS, _CAPTCHA_CHECKS)
+    except Exception:
+        return None
+    if captcha_type:
+        logger.info("Detected CAPTCHA type: %s", captcha_type)
+    return captcha_type
+
+
+# Page -> (navigation count, loop time) of its last clean (no CAPTCHA) check.
+# Lets back-to-back checks of the same document skip the probes. Keyed per
+# page so one pooled tab's result never covers another's document; the
+# count changes on every main-frame navigation, including mid-probe ones.
+_CLEAN_TTL_SECONDS = 5.0
+_last_clean: WeakKeyDictionary[Page, tuple[int, float]] = WeakKeyDictionary()
+_navigations: WeakKeyDictionary[Page, int] = WeakKeyDictionary()
+
+
+def track_navigation(page: Page):
+    """Invalidate cached clean results whenever the page's main frame navigates."""
+    _navigations[page] = 0
+
+    def on_navigated(frame):
+        if frame == page.main_frame:
+            _navigations[page] = _navigations.get(page, 0) + 1
+            _last_clean.pop(page, None)
+
+    page.on("framenavigated", on_navigated)
 
 
 async def handle_captcha(page: Page, timeout_ms: int = 30000) -> dict:
@@ -86,6 +145,12 @@ async def handle_captcha(page: Page, timeout_ms: int = 30000) -> dict:
     Returns:
         dict with keys: resolved (bool), captcha_type (str|None), message (str)
     """
+    now = asyncio.get_running_loop().time()
+    navigation = _navigations.get(page)
+    last = _last_clean.get(page)
+    if last is not None and last[0] == navigation and last[1] > now - _CLEAN_TTL_SECONDS:
+        return {"resolved": True, "captcha_type": None, "message": "No CAPTCHA detected."}
+
     # Layer 1: Cloudflare interstitial
     if await detect_cloudflare(page):
         resolved = await wait_for_cloudflare_resolution(page, timeout_ms)
@@ -114,5 +179,7 @@ async def handle_captcha(page: Page, timeout_ms: int = 30000) -> dict:
             "message": f"{captcha_type} CAPTCHA detected. Please solve it in the browser window.",
         }
 
-    # No CAPTCHA
+    # No CAPTCHA. Only untracked pages (navigation None) are never cached.
+    if navigation is not None:
+        _last_clean[page] = (navigation, now)
     return {"resolved": True, "captcha_type": None, "message": "No CAPTCHA detected."}
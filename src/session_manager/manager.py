@@ -7,27 +7,50 @@ and cookie management.
 Endpoints:
     POST /start         - Launch browser, attempt session restore
     GET  /status        - Return session state
+    POST /check-auth    - Re-check login state
     POST /stop          - Close browser, save state
-    POST /scrape/best-matches  - Scrape best matches
-    POST /scrape/search        - Scrape search results
-    POST /scrape/job-detail    - Scrape single job detail
+    POST /scrape/best-matches      - Scrape best matches
+    POST /scrape/search            - Scrape search results
+    POST /scrape/job-detail        - Scrape single job detail
+    POST /scrape/job-detail-batch  - Scrape several job details concurrently
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import multiprocessing
+import socket
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, TypeVar
 from urllib.parse import urlencode
 
 import aiosqlite
+import orjson
 from aiohttp import web
-
-from ..config import DB_PATH, SESSION_MANAGER_HOST, SESSION_MANAGER_PORT, ensure_dirs
-from ..constants import UPWORK_BASE, UPWORK_SEARCH_URL
-from ..database.models import initialize_db
+from pydantic import TypeAdapter
+
+try:
+    import uvloop
+except ImportError:  # optional "speedups" extra; not available on Windows
+    uvloop = None
+
+from ..config import (
+    DATA_DIR,
+    DEBUG_DUMP_HTML,
+    LOG_LEVEL,
+    SESSION_MANAGER_HOST,
+    SESSION_MANAGER_PORT,
+    SESSION_MANAGER_SOCKET,
+    ensure_dirs,
+)
+from ..constants import UPWORK_BASE, UPWORK_BEST_MATCHES_URL, UPWORK_SEARCH_URL
+from ..database.connection import close_db, get_db, get_read_db
+from ..database.models import run_maintenance
 from ..database.repository import JobRepository
 from ..models.job import Job, SearchParams
 from .browser import BrowserSession
@@ -38,7 +61,18 @@ if not logger.handlers:
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s"))
     logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
+
+
+# Job fields a parsed tile may carry (see parser._parse_single_tile)
+_TILE_FIELDS = (
+    "id", "url", "title", "description", "budget_type", "budget_amount",
+    "hourly_rate_min", "hourly_rate_max", "skills", "experience_level",
+    "proposals_count", "posted_date",
+)
+
+# Seconds a /status job count is reused before querying again
+JOB_COUNT_TTL = 2.0
 
 
 class SessionManager:
@@ -48,61 +82,145 @@ class SessionManager:
         self.browser = BrowserSession()
         self.db: aiosqlite.Connection | None = None
         self.repo: JobRepository | None = None
-        self._last_scrape_time: str | None = None
+        # Separate connection for reads so /status never waits on a scrape's upsert
+        self.read_repo: JobRepository | None = None
+        self._write_lock = asyncio.Lock()
+        # (count, monotonic time) so frequent /status polls skip COUNT(*)
+        self._job_count_cache: tuple[int, float] | None = None
+        # Epoch ns of the last scrape; only formatted when /status is served
+        self._last_scrape_ns: int | None = None
 
     async def setup(self):
-        """Initialize database connection."""
-        ensure_dirs()
-        self.db = await aiosqlite.connect(str(DB_PATH))
-        self.db.row_factory = aiosqlite.Row
-        await initialize_db(self.db)
+        """Initialize database connections."""
+        self.db = await get_db()
         self.repo = JobRepository(self.db)
+        self.read_repo = JobRepository(await get_read_db())
 
     async def cleanup(self):
         """Clean up resources."""
         await self.browser.stop()
         if self.db:
-            await self.db.close()
+            await close_db()
+            self.db = None
+            self.repo = self.read_repo = None
+
+    @property
+    def last_scrape_time(self) -> str | None:
+        """UTC ISO timestamp of the last successful scrape, if any."""
+        if self._last_scrape_ns is None:
+            return None
+        scraped_at = datetime.fromtimestamp(self._last_scrape_ns / 1e9, timezone.utc)
+        return scraped_at.replace(tzinfo=None).isoformat()
+
+    async def job_count(self) -> int:
+        """Number of cached jobs, re-counted at most every JOB_COUNT_TTL seconds."""
+        now = time.monotonic()
+        cached = self._job_count_cache
+        if cached and now - cached[1] < JOB_COUNT_TTL:
+            return cached[0]
+        count = await self.read_repo.get_job_count()
+        self._job_count_cache = (count, now)
+        return count
+
+    async def save_jobs(self, jobs: list[Job]):
+        """Upsert scraped jobs, one writer at a time."""
+        async with self._write_lock:
+            await self.repo.upsert_jobs(jobs)
+        # Upserts may update rather than insert, so re-count on next /status
+        self._job_count_cache = None
+
+    async def save_job(self, job: Job):
+        """Upsert a single scraped job, one writer at a time."""
+        async with self._write_lock:
+            await self.repo.upsert_job(job)
+        self._job_count_cache = None
 
     def _tiles_to_jobs(self, tiles: list[dict], source: str = "") -> list[Job]:
-        """Convert parsed tile dicts into Job objects."""
+        """Convert parsed tile dicts into Job objects.
+
+        Tiles come from our own parser with already-typed values, so the
+        Jobs are built with model_construct (defaults, no validation).
+        """
         jobs = []
         for tile in tiles:
-            job = Job(
-                id=tile["id"],
-                url=tile["url"],
-                title=tile.get("title", "Untitled"),
-                description=tile.get("description", ""),
-                budget_type=tile.get("budget_type", ""),
-                budget_amount=tile.get("budget_amount"),
-                hourly_rate_min=tile.get("hourly_rate_min"),
-                hourly_rate_max=tile.get("hourly_rate_max"),
-                skills=tile.get("skills", []),
-                experience_level=tile.get("experience_level", ""),
-                proposals_count=tile.get("proposals_count"),
-                posted_date=tile.get("posted_date", ""),
-                source=source or tile.get("source", ""),
-            )
-            jobs.append(job)
+            fields = {key: tile[key] for key in _TILE_FIELDS if key in tile}
+            fields.setdefault("title", "Untitled")
+            fields["source"] = source or tile.get("source", "")
+            jobs.append(Job.model_construct(**fields))
         return jobs
 
 
 # ── HTTP Handlers ────────────────────────────────────────────────────────────
 
+MANAGER_KEY = web.AppKey("manager", SessionManager)
+MAINTENANCE_TASK_KEY = web.AppKey("maintenance_task", asyncio.Task)
+PARSE_POOL_KEY = web.AppKey("parse_pool", ProcessPoolExecutor)
+
+# Worker processes for HTML parsing, which is CPU-bound and would otherwise
+# block every other handler on the event loop for the length of the parse
+PARSE_WORKERS = 2
+
+# Never fork workers from this multi-threaded process (event loop, aiosqlite
+# and Playwright threads): a lock held at fork time can deadlock the child
+_PARSE_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+T = TypeVar("T")
+
+
+async def _parse(request: web.Request, parse_fn: Callable[..., T], *args) -> T:
+    """Run a parser function in the app's process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(request.app[PARSE_POOL_KEY], parse_fn, *args)
+
+
+# Scrape results are dumped in one pydantic-core pass rather than per Job
+_JOBS_ADAPTER = TypeAdapter(list[Job])
+_SUMMARY_EXCLUDE = {"__all__": {"raw_html", "description"}}
+
+
+async def _read_json(request: web.Request) -> dict:
+    """Parse the request body with orjson; an empty body is an empty dict."""
+    raw = await request.read()
+    return orjson.loads(raw) if raw else {}
+
+
+# Bodies at least this large (scrape results) are compressed when the client
+# accepts it; below that, compressing costs more than the bytes it saves
+_COMPRESS_MIN_BYTES = 32 * 1024
+
+
+def _raw_json_response(body: bytes, status: int = 200) -> web.Response:
+    """Response for an already-encoded JSON body."""
+    response = web.Response(body=body, status=status, content_type="application/json")
+    if len(body) >= _COMPRESS_MIN_BYTES:
+        response.enable_compression()
+    return response
+
+
+def _json_response(data, status: int = 200) -> web.Response:
+    """JSON response serialized with orjson (C, one pass) instead of stdlib json."""
+    return _raw_json_response(orjson.dumps(data), status)
+
+
+# Fixed error bodies encoded once at import (a Response itself can't be reused)
+_NOT_AUTHENTICATED_BODY = orjson.dumps({"error": "Not authenticated. Call /start first."})
+
 
 async def handle_start(request: web.Request) -> web.Response:
-    mgr: SessionManager = request.app["manager"]
-    body = await request.json() if request.content_length else {}
+    mgr = request.app[MANAGER_KEY]
+    body = await _read_json(request)
     headless = body.get("headless", False)
 
     result = await mgr.browser.start(headless=headless)
-    return web.json_response(result)
+    return _json_response(result)
 
 
 async def handle_status(request: web.Request) -> web.Response:
-    mgr: SessionManager = request.app["manager"]
+    mgr = request.app[MANAGER_KEY]
 
-    jobs_count = await mgr.repo.get_job_count() if mgr.repo else 0
+    jobs_count = await mgr.job_count() if mgr.read_repo else 0
 
     status = {
         "is_active": mgr.browser.is_authenticated,
@@ -111,169 +229,251 @@ async def handle_status(request: web.Request) -> web.Response:
         ),
         "cookie_count": len(mgr.browser.cookies),
         "jobs_in_cache": jobs_count,
-        "last_scrape_time": mgr._last_scrape_time,
+        "last_scrape_time": mgr.last_scrape_time,
         "message": "",
     }
-    return web.json_response(status)
+    return _json_response(status)
 
 
 async def handle_check_auth(request: web.Request) -> web.Response:
-    mgr: SessionManager = request.app["manager"]
+    mgr = request.app[MANAGER_KEY]
     result = await mgr.browser.check_auth()
-    return web.json_response(result)
+    return _json_response(result)
 
 
 async def handle_stop(request: web.Request) -> web.Response:
-    mgr: SessionManager = request.app["manager"]
+    mgr = request.app[MANAGER_KEY]
     await mgr.browser.stop()
-    return web.json_response({"message": "Session stopped. Cached data is still available."})
+    return _json_response({"message": "Session stopped. Cached data is still available."})
 
 
 async def handle_scrape_best_matches(request: web.Request) -> web.Response:
-    mgr: SessionManager = request.app["manager"]
-    body = await request.json() if request.content_length else {}
+    mgr = request.app[MANAGER_KEY]
+    body = await _read_json(request)
     max_jobs = body.get("max_jobs", 20)
 
     if not mgr.browser.is_authenticated:
-        return web.json_response(
-            {"error": "Not authenticated. Call /start first."},
-            status=401,
-        )
+        return _raw_json_response(_NOT_AUTHENTICATED_BODY, status=401)
 
     try:
-        from pathlib import Path
-        from ..constants import UPWORK_BEST_MATCHES_URL
-
-        # Step 1: Navigate to Best Matches
-        logger.info(f"[SCRAPE] Step 1: Navigating to {UPWORK_BEST_MATCHES_URL}")
-        html = await mgr.browser.get_page_html(UPWORK_BEST_MATCHES_URL)
-        logger.info(f"[SCRAPE] Step 1 done: got {len(html)} chars from get_page_html")
-
-        # Step 2: Scroll to load more jobs
-        logger.info("[SCRAPE] Step 2: Scrolling to load more jobs...")
-        html = await mgr.browser.scroll_and_collect(max_scrolls=5)
-        logger.info(f"[SCRAPE] Step 2 done: got {len(html)} chars after scrolling")
-
-        # Save HTML for debugging
-        debug_path = Path("data/debug_best_matches.html")
-        try:
-            debug_path.parent.mkdir(parents=True, exist_ok=True)
-            debug_path.write_text(html, encoding="utf-8")
-            logger.info(f"[SCRAPE] Debug HTML saved to {debug_path.resolve()}")
-        except Exception as e:
-            logger.warning(f"[SCRAPE] Could not save debug HTML: {e}")
-
-        # Step 3: Parse tiles and create Job objects directly from tile data
-        logger.info(f"[SCRAPE] Step 3: Parsing tiles (max_jobs={max_jobs})...")
-        tiles = parse_job_tiles_from_html(html, source="best_matches")
-        tiles = tiles[:max_jobs]
+        async with mgr.browser.acquire_page() as page:
+            # Step 1: Navigate to Best Matches and scroll to load more jobs
+            logger.info("[SCRAPE] Step 1: Navigating to %s and scrolling", UPWORK_BEST_MATCHES_URL)
+            html = await mgr.browser.navigate_and_scroll(
+                UPWORK_BEST_MATCHES_URL, max_scrolls=5, page=page, stop_at_tiles=max_jobs
+            )
+            logger.info("[SCRAPE] Step 1 done: got %d chars after scrolling", len(html))
+
+        if DEBUG_DUMP_HTML:
+            debug_path = DATA_DIR / "debug_best_matches.html"
+            try:
+                await asyncio.to_thread(debug_path.write_text, html, encoding="utf-8")
+                logger.info("[SCRAPE] Debug HTML saved to %s", debug_path)
+            except Exception as e:
+                logger.warning("[SCRAPE] Could not save debug HTML: %s", e)
+
+        # Step 2: Parse tiles and create Job objects directly from tile data
+        logger.info("[SCRAPE] Step 2: Parsing tiles (max_jobs=%s)...", max_jobs)
+        tiles = await _parse(request, parse_job_tiles_from_html, html, "best_matches", max_jobs)
         jobs = mgr._tiles_to_jobs(tiles, source="best_matches")
-        logger.info(f"[SCRAPE] Step 3 done: got {len(jobs)} jobs from tiles")
+        logger.info("[SCRAPE] Step 2 done: got %d jobs from tiles", len(jobs))
 
-        # Step 4: Save to database
+        # Step 3: Save to database
         if mgr.repo:
-            await mgr.repo.upsert_jobs(jobs)
-            logger.info(f"[SCRAPE] Step 4: Saved {len(jobs)} jobs to database")
+            await mgr.save_jobs(jobs)
+            logger.info("[SCRAPE] Step 3: Saved %d jobs to database", len(jobs))
 
-        mgr._last_scrape_time = datetime.utcnow().isoformat()
+        mgr._last_scrape_ns = time.time_ns()
 
-        summaries = [j.model_dump(exclude={"raw_html", "description"}) for j in jobs]
-        return web.json_response({"jobs": summaries, "count": len(jobs)})
+        summaries = _JOBS_ADAPTER.dump_python(jobs, exclude=_SUMMARY_EXCLUDE)
+        return _json_response({"jobs": summaries, "count": len(jobs)})
 
     except Exception as e:
-        logger.error(f"Best matches scrape failed: {e}", exc_info=True)
-        return web.json_response({"error": str(e)}, status=500)
+        logger.error("Best matches scrape failed: %s", e, exc_info=True)
+        return _json_response({"error": str(e)}, status=500)
 
 
 async def handle_scrape_search(request: web.Request) -> web.Response:
-    mgr: SessionManager = request.app["manager"]
-    body = await request.json() if request.content_length else {}
+    mgr = request.app[MANAGER_KEY]
+    body = await _read_json(request)
 
     try:
         params = SearchParams(**body)
     except Exception as e:
-        return web.json_response({"error": f"Invalid params: {e}"}, status=400)
+        return _json_response({"error": f"Invalid params: {e}"}, status=400)
 
     if not mgr.browser.is_authenticated:
-        return web.json_response(
-            {"error": "Not authenticated. Call /start first."},
-            status=401,
-        )
+        return _raw_json_response(_NOT_AUTHENTICATED_BODY, status=401)
 
     try:
         url_params = params.to_url_params()
         search_url = f"{UPWORK_SEARCH_URL}?{urlencode(url_params)}"
-        logger.info(f"[SEARCH] query='{params.query}', url={search_url}")
+        logger.info("[SEARCH] query='%s', url=%s", params.query, search_url)
 
         # Use browser to load search results (avoids Cloudflare 403)
-        html = await mgr.browser.get_page_html(search_url)
-        html = await mgr.browser.scroll_and_collect(max_scrolls=3)
-        logger.info(f"[SEARCH] Got {len(html)} chars of HTML after scrolling")
+        async with mgr.browser.acquire_page() as page:
+            html = await mgr.browser.navigate_and_scroll(
+                search_url, max_scrolls=3, page=page, stop_at_tiles=params.max_results
+            )
+        logger.info("[SEARCH] Got %d chars of HTML after scrolling", len(html))
 
-        tiles = parse_job_tiles_from_html(html, source="search")
-        tiles = tiles[:params.max_results]
+        tiles = await _parse(
+            request, parse_job_tiles_from_html, html, "search", params.max_results
+        )
         jobs = mgr._tiles_to_jobs(tiles, source="search")
         for job in jobs:
             job.search_query = params.query
-        logger.info(f"[SEARCH] Got {len(jobs)} jobs from tiles")
+        logger.info("[SEARCH] Got %d jobs from tiles", len(jobs))
 
         if mgr.repo:
-            await mgr.repo.upsert_jobs(jobs)
+            await mgr.save_jobs(jobs)
 
-        mgr._last_scrape_time = datetime.utcnow().isoformat()
+        mgr._last_scrape_ns = time.time_ns()
 
-        summaries = [j.model_dump(exclude={"raw_html", "description"}) for j in jobs]
-        return web.json_response({"jobs": summaries, "count": len(jobs)})
+        summaries = _JOBS_ADAPTER.dump_python(jobs, exclude=_SUMMARY_EXCLUDE)
+        return _json_response({"jobs": summaries, "count": len(jobs)})
 
     except Exception as e:
-        logger.error(f"Search scrape failed: {e}", exc_info=True)
-        return web.json_response({"error": str(e)}, status=500)
+        logger.error("Search scrape failed: %s", e, exc_info=True)
+        return _json_response({"error": str(e)}, status=500)
 
 
 async def handle_scrape_job_detail(request: web.Request) -> web.Response:
-    mgr: SessionManager = request.app["manager"]
-    body = await request.json() if request.content_length else {}
+    mgr = request.app[MANAGER_KEY]
+    body = await _read_json(request)
     job_url = body.get("job_url", "")
 
     if not job_url:
-        return web.json_response({"error": "job_url is required."}, status=400)
+        return _json_response({"error": "job_url is required."}, status=400)
 
     if job_url.startswith("~"):
         job_url = f"{UPWORK_BASE}/jobs/{job_url}"
 
     if not mgr.browser.is_authenticated:
-        return web.json_response(
-            {"error": "Not authenticated. Call /start first."},
-            status=401,
-        )
+        return _raw_json_response(_NOT_AUTHENTICATED_BODY, status=401)
 
     try:
         # Use browser to navigate to job page (avoids Cloudflare 403)
-        html = await mgr.browser.get_page_html(job_url)
-        job = parse_job_detail(html, job_url)
+        async with mgr.browser.acquire_page() as page:
+            html = await mgr.browser.get_page_html(job_url, page=page)
+        job = await _parse(request, parse_job_detail, html, job_url)
 
         if mgr.repo:
-            await mgr.repo.upsert_job(job)
+            await mgr.save_job(job)
 
-        return web.json_response({"job": job.model_dump(exclude={"raw_html"})})
+        return _json_response({"job": job.model_dump(exclude={"raw_html"})})
 
     except Exception as e:
-        logger.error(f"Job detail scrape failed: {e}")
-        return web.json_response({"error": str(e)}, status=500)
+        logger.error("Job detail scrape failed: %s", e)
+        return _json_response({"error": str(e)}, status=500)
+
+
+# Most job URLs one /scrape/job-detail-batch call will visit
+MAX_DETAIL_BATCH = 20
+
+
+async def handle_scrape_job_detail_batch(request: web.Request) -> web.Response:
+    mgr = request.app[MANAGER_KEY]
+    body = await _read_json(request)
+    job_urls = body.get("job_urls")
+
+    if not job_urls or not isinstance(job_urls, list) or not all(isinstance(u, str) and u for u in job_urls):
+        return _json_response({"error": "job_urls must be a non-empty list of URLs."}, status=400)
+    if len(job_urls) > MAX_DETAIL_BATCH:
+        return _json_response(
+            {"error": f"At most {MAX_DETAIL_BATCH} job_urls per batch."}, status=400
+        )
+
+    if not mgr.browser.is_authenticated:
+        return _raw_json_response(_NOT_AUTHENTICATED_BODY, status=401)
+
+    job_urls = [f"{UPWORK_BASE}/jobs/{u}" if u.startswith("~") else u for u in job_urls]
+    logger.info("[DETAIL-BATCH] Fetching %d jobs on one page", len(job_urls))
+
+    # One pooled page visits every URL in turn; each page's parse runs in the
+    # process pool while the browser is already navigating to the next one
+    parses: list[tuple[str, asyncio.Future]] = []
+    errors = []
+    try:
+        async with mgr.browser.acquire_page() as page:
+            for job_url in job_urls:
+                try:
+                    html = await mgr.browser.get_page_html(job_url, page=page)
+                except Exception as e:
+                    logger.warning("[DETAIL-BATCH] Navigation failed for %s: %s", job_url, e)
+                    errors.append({"job_url": job_url, "error": str(e)})
+                    continue
+                parses.append(
+                    (job_url, asyncio.ensure_future(_parse(request, parse_job_detail, html, job_url)))
+                )
+    except Exception as e:
+        for _, parse in parses:
+            parse.cancel()
+        logger.error("Job detail batch failed: %s", e, exc_info=True)
+        return _json_response({"error": str(e)}, status=500)
+
+    jobs = []
+    for job_url, parse in parses:
+        try:
+            jobs.append(await parse)
+        except Exception as e:
+            logger.warning("[DETAIL-BATCH] Parse failed for %s: %s", job_url, e)
+            errors.append({"job_url": job_url, "error": str(e)})
+
+    if jobs and mgr.repo:
+        await mgr.save_jobs(jobs)
+    logger.info("[DETAIL-BATCH] Got %d/%d jobs", len(jobs), len(job_urls))
+
+    return _json_response({
+        "jobs": _JOBS_ADAPTER.dump_python(jobs, exclude={"__all__": {"raw_html"}}),
+        "count": len(jobs),
+        "errors": errors,
+    })
 
 
 # ── App Factory ──────────────────────────────────────────────────────────────
 
+# Seconds between WAL checkpoint / PRAGMA optimize runs
+DB_MAINTENANCE_INTERVAL = 900
+
+
+async def _maintenance_loop(mgr: SessionManager):
+    """Periodically checkpoint the WAL and re-optimize the database."""
+    while True:
+        await asyncio.sleep(DB_MAINTENANCE_INTERVAL)
+        try:
+            await run_maintenance(mgr.db)
+            logger.debug("Database maintenance done")
+        except Exception as e:
+            logger.warning("Database maintenance failed: %s", e)
+
+
+async def _start_parse_pool() -> ProcessPoolExecutor:
+    """Create the parser pool and start its workers before the first scrape."""
+    pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=_PARSE_MP_CONTEXT)
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(pool, int) for _ in range(PARSE_WORKERS)))
+    return pool
+
 
 async def on_startup(app: web.Application):
+    app[PARSE_POOL_KEY] = await _start_parse_pool()
     mgr = SessionManager()
     await mgr.setup()
-    app["manager"] = mgr
-    logger.info(f"Session Manager started on {SESSION_MANAGER_HOST}:{SESSION_MANAGER_PORT}")
+    app[MANAGER_KEY] = mgr
+    app[MAINTENANCE_TASK_KEY] = asyncio.create_task(_maintenance_loop(mgr))
+    logger.info("Session Manager started on %s:%s", SESSION_MANAGER_HOST, SESSION_MANAGER_PORT)
 
 
 async def on_cleanup(app: web.Application):
-    mgr: SessionManager = app["manager"]
+    app[PARSE_POOL_KEY].shutdown(wait=False, cancel_futures=True)
+    task = app[MAINTENANCE_TASK_KEY]
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    mgr = app[MANAGER_KEY]
     await mgr.cleanup()
     logger.info("Session Manager stopped.")
 
@@ -290,14 +490,51 @@ def create_app() -> web.Application:
     app.router.add_post("/scrape/best-matches", handle_scrape_best_matches)
     app.router.add_post("/scrape/search", handle_scrape_search)
     app.router.add_post("/scrape/job-detail", handle_scrape_job_detail)
+    app.router.add_post("/scrape/job-detail-batch", handle_scrape_job_detail_batch)
 
     return app
 
 
+def _bind_unix_socket(path: Path) -> socket.socket | None:
+    """Bind the unix socket at ``path``, or None if this platform/path can't.
+
+    Only called once the TCP port is ours, so any existing file there is
+    left over from a crashed run rather than a live instance.
+    """
+    ensure_dirs()
+    path.unlink(missing_ok=True)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(str(path))
+    except OSError as e:
+        # e.g. "AF_UNIX path too long" under a deep DATA_DIR; clients use TCP
+        sock.close()
+        logger.warning("Unix socket %s unavailable (%s), serving TCP only", path, e)
+        return None
+    return sock
+
+
 def main():
-    """Run the session manager as a standalone HTTP service."""
+    """Run the session manager HTTP service (also spawned by the MCP server)."""
+    if uvloop is not None:
+        # run_app creates its loop from the policy, so this must come first
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     app = create_app()
-    web.run_app(app, host=SESSION_MANAGER_HOST, port=SESSION_MANAGER_PORT)
+    # Take the TCP port first: if another instance already holds it, exit
+    # here without touching its unix socket
+    sockets = [socket.create_server((SESSION_MANAGER_HOST, SESSION_MANAGER_PORT))]
+    socket_path = Path(SESSION_MANAGER_SOCKET) if SESSION_MANAGER_SOCKET else None
+    if socket_path:
+        unix_sock = _bind_unix_socket(socket_path)
+        if unix_sock is None:
+            socket_path = None
+        else:
+            sockets.append(unix_sock)
+    try:
+        web.run_app(app, sock=sockets)
+    finally:
+        if socket_path:
+            socket_path.unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
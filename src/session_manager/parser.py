@@ -17,12 +17,34 @@ import json
 import logging
 import re
 import sys
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
-
-from ..constants import SELECTORS, UPWORK_BASE
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # no wheel for this platform; use the pure-Python tree
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+
+    _BS4_FEATURES = "lxml"
+except ImportError:
+    _BS4_FEATURES = "html.parser"
+
+from ..config import LOG_LEVEL
+from ..constants import (
+    JOB_TILE_SELECTORS,
+    JOB_TILE_SKILL_SELECTORS,
+    JOB_TILE_TITLE_SELECTORS,
+    SELECTORS,
+    UPWORK_BASE,
+)
 from ..models.job import Job
 
 logger = logging.getLogger(__name__)
@@ -30,24 +52,109 @@ if not logger.handlers:
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s"))
     logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
+
+
+# ── HTML Tree Access ────────────────────────────────────────────────────────
+#
+# Pages are parsed with selectolax's lexbor engine (C, no per-node Python
+# objects) when it is installed, else with BeautifulSoup (on lxml if present).
+# Both accept the same CSS selectors; these helpers hide the API differences.
+
+# A LexborNode/LexborHTMLParser, or a BeautifulSoup Tag
+Node = Any
+
+
+def _parse_html(html: str, only: Optional[str] = None) -> Node:
+    """Parse an HTML document into a queryable tree.
+
+    ``only`` names the one tag the caller needs; the BeautifulSoup fallback
+    then skips building the rest of the tree. lexbor is fast enough to
+    always parse the whole document.
+    """
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    strainer = SoupStrainer(only) if only else None
+    return BeautifulSoup(html, _BS4_FEATURES, parse_only=strainer)
+
+
+def _select_one(node: Node, selector: str) -> Optional[Node]:
+    """Return the first element matching a CSS selector, or None."""
+    if LexborHTMLParser is not None:
+        return node.css_first(selector)
+    return node.select_one(selector)
+
+
+def _select(node: Node, selector: str) -> list[Node]:
+    """Return all elements matching a CSS selector."""
+    if LexborHTMLParser is not None:
+        return node.css(selector)
+    return node.select(selector)
+
+
+def _text(node: Node) -> str:
+    """Return the concatenated text content of an element."""
+    if LexborHTMLParser is not None:
+        return node.text()
+    return node.get_text()
+
+
+def _attr(node: Node, name: str) -> str:
+    """Return an attribute value, or "" if it is missing or valueless."""
+    if LexborHTMLParser is not None:
+        return node.attributes.get(name) or ""
+    return node.get(name) or ""
+
+
+def _index_by_attr(node: Node, name: str) -> dict[str, Node]:
+    """Map each value of attribute ``name`` below ``node`` to its first element.
+
+    One selector pass replaces a ``_select_one('[name="value"]')`` per field.
+    """
+    matches = _select(node, f"[{name}]")
+    # lexbor's css() also matches the node itself, which always comes first
+    if LexborHTMLParser is not None and matches and matches[0] == node:
+        matches = matches[1:]
+    index: dict[str, Node] = {}
+    for el in matches:
+        index.setdefault(_attr(el, name), el)
+    return index
 
 
 # ── Utility Functions ────────────────────────────────────────────────────────
 
+_MONEY_RE = re.compile(r"[\$]?([\d,]+(?:\.\d{2})?)")
+_INT_RE = re.compile(r"(\d+)")
+_JOB_ID_RE = re.compile(r"(~[0-9a-f]+)")
+_RATE_RANGE_RE = re.compile(r"\$([\d,.]+)\s*[-–]\s*\$([\d,.]+)")
+_JOB_LINK_RE = re.compile(r"/jobs/.*~|/details/.*~")
+
+# Titles, skill names and labels repeat across tiles; descriptions rarely
+# do, so only strings up to this length go through the cache.
+_CLEAN_TEXT_CACHE_MAX_LEN = 200
+
+
+@lru_cache(maxsize=8192)
+def _clean_short_text(text: str) -> str:
+    return " ".join(text.split())
+
 
 def _clean_text(text: str | None) -> str:
     """Strip whitespace and normalize text."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text).strip()
+    if len(text) <= _CLEAN_TEXT_CACHE_MAX_LEN:
+        return _clean_short_text(text)
+    return " ".join(text.split())
 
 
 def _parse_money(text: str) -> Optional[float]:
     """Extract a numeric dollar amount from text like '$1,500.00'."""
     if not text:
         return None
-    match = re.search(r"[\$]?([\d,]+(?:\.\d{2})?)", text.replace(",", ""))
+    if text.isdecimal():  # bare digits, e.g. NUXT values serialized as strings
+        return float(text)
+    match = _MONEY_RE.search(text.replace(",", ""))
     if match:
         try:
             return float(match.group(1).replace(",", ""))
@@ -60,7 +167,9 @@ def _parse_int(text: str) -> Optional[int]:
     """Extract an integer from text like '15 proposals' or '5-10'."""
     if not text:
         return None
-    match = re.search(r"(\d+)", text)
+    if text.isdecimal():
+        return int(text)
+    match = _INT_RE.search(text)
     if match:
         try:
             return int(match.group(1))
@@ -69,47 +178,95 @@ def _parse_int(text: str) -> Optional[int]:
     return None
 
 
+def _absolute_url(href: str) -> str:
+    """Resolve a link from an Upwork page against UPWORK_BASE.
+
+    Job links are absolute or root-relative, which need no URL parsing;
+    anything else goes through urljoin.
+    """
+    if href.startswith(("https://", "http://")):
+        return href
+    if href.startswith("/") and not href.startswith("//"):
+        return UPWORK_BASE + href
+    return urljoin(UPWORK_BASE, href)
+
+
+@lru_cache(maxsize=4096)
 def _extract_job_id_from_url(url: str) -> str:
     """Extract job ID like ~01abc123 from a URL."""
-    match = re.search(r"(~[0-9a-f]+)", url)
+    match = _JOB_ID_RE.search(url)
     return match.group(1) if match else ""
 
 
 # ── NUXT Data Parser ────────────────────────────────────────────────────────
 
+# Script bodies are raw text in HTML, so string search finds the same
+# content the tree would return without building one.
+_NUXT_DATA_ID = 'id="__NUXT_DATA__"'
+_WINDOW_STATE_RE = re.compile(r"window\.__(?:NUXT|INITIAL_STATE)__\s*=\s*({.*?});", re.DOTALL)
+
+
+def _loads_json(text: str) -> Any:
+    """Parse JSON with orjson, retrying with the stdlib on rejection.
+
+    orjson is stricter (no NaN, lone surrogates or ints beyond 64 bits);
+    the retry keeps such payloads parseable. Invalid JSON raises
+    json.JSONDecodeError either way.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+def _find_nuxt_script(html: str) -> Optional[str]:
+    """Return the __NUXT_DATA__ script body using plain string search.
 
-def _parse_nuxt_data(html: str) -> Optional[list]:
+    Returns None unless the page uses the usual
+    ``<script ... id="__NUXT_DATA__" ...>`` form.
+    """
+    start = html.find(_NUXT_DATA_ID)
+    if start < 0:
+        return None
+    tag_start = html.rfind("<", 0, start)
+    if tag_start < 0 or not html.startswith("<script", tag_start):
+        return None
+    body_start = html.find(">", start) + 1
+    body_end = html.find("</script>", body_start) if body_start else -1
+    if body_end < 0:
+        return None
+    return html[body_start:body_end]
+
+
+def _parse_nuxt_data(html: str, tree: Optional[Node] = None) -> Optional[list]:
     """Extract and parse the __NUXT_DATA__ script tag.
 
     Upwork uses Nuxt.js which serializes page data as a flat array
     with index references. Values like "city":141 mean "look up
     index 141 in the data array."
-    """
-    soup = BeautifulSoup(html, "html.parser")
 
+    The script is located by string search on the raw HTML; the parsed
+    ``tree`` (built here if not passed) is only needed for markup the
+    search doesn't recognize.
+    """
     # Try the standard NUXT data tag
-    script = soup.find("script", id="__NUXT_DATA__")
-    if script and script.string:
+    text = _find_nuxt_script(html)
+    if text is None and "__NUXT_DATA__" in html:
+        tree = tree if tree is not None else _parse_html(html, only="script")
+        script = _select_one(tree, "script#__NUXT_DATA__")
+        text = _text(script) if script else ""
+    if text:
         try:
-            return json.loads(script.string)
+            return _loads_json(text)
         except json.JSONDecodeError:
             logger.warning("Failed to parse __NUXT_DATA__ JSON.")
 
     # Try window.__NUXT__ or window.__INITIAL_STATE__
-    for script_tag in soup.find_all("script"):
-        if not script_tag.string:
+    for match in _WINDOW_STATE_RE.finditer(html):
+        try:
+            return [_loads_json(match.group(1))]
+        except json.JSONDecodeError:
             continue
-        text = script_tag.string
-        for pattern in [
-            r"window\.__NUXT__\s*=\s*({.*?});",
-            r"window\.__INITIAL_STATE__\s*=\s*({.*?});",
-        ]:
-            match = re.search(pattern, text, re.DOTALL)
-            if match:
-                try:
-                    return [json.loads(match.group(1))]
-                except json.JSONDecodeError:
-                    continue
 
     return None
 
@@ -128,78 +285,76 @@ def _resolve_nuxt_value(data: list, index: int) -> Any:
 # ── Job Tile Parsers (Best Matches & Search Results) ────────────────────────
 
 
-def parse_job_tiles_from_html(html: str, source: str = "best_matches") -> list[dict]:
+def parse_job_tiles_from_html(
+    html: str, source: str = "best_matches", limit: Optional[int] = None
+) -> list[dict]:
     """Extract job URLs and basic info from a list page (Best Matches or Search).
 
-    Returns a list of dicts with minimal info (id, url, title).
-    Full details are fetched separately via get_job_details.
+    Returns a list of dicts with minimal info (id, url, title), at most
+    ``limit`` of them when given. Full details are fetched separately via
+    get_job_details.
     """
-    logger.info(f"[PARSER] parse_job_tiles: source={source}, html_size={len(html)} chars")
-    soup = BeautifulSoup(html, "html.parser")
+    logger.info("[PARSER] parse_job_tiles: source=%s, html_size=%d chars", source, len(html))
+    tree = _parse_html(html)
     jobs = []
 
-    # Log page identity for debugging
-    title_tag = soup.find("title")
-    page_title = title_tag.get_text() if title_tag else "(no <title>)"
-    logger.info(f"[PARSER] Page <title>: '{page_title}'")
+    # Log page identity and a body preview to detect Cloudflare/error/empty
+    # pages; walking the body text is skipped entirely when INFO is off
+    if logger.isEnabledFor(logging.INFO):
+        title_tag = _select_one(tree, "title")
+        page_title = _text(title_tag) if title_tag else "(no <title>)"
+        logger.info("[PARSER] Page <title>: '%s'", page_title)
 
-    # Log body text preview to detect Cloudflare/error/empty pages
-    body = soup.find("body")
-    if body:
-        body_text = _clean_text(body.get_text())[:300]
-        logger.info(f"[PARSER] Body text preview: {body_text}")
-    else:
-        logger.warning("[PARSER] No <body> tag in HTML!")
+        body = _select_one(tree, "body")
+        if body:
+            logger.info("[PARSER] Body text preview: %s", _clean_text(_text(body))[:300])
+        else:
+            logger.warning("[PARSER] No <body> tag in HTML!")
 
     # Try multiple selector strategies for job tiles
-    tile_selectors = [
-        '[data-test="job-tile-list"] > section',  # Current Upwork (2025+): sections inside job-tile-list
-        "article.job-tile",
-        'article[data-test="JobTile"]',
-        'div[data-test="job-tile-list"] article',
-        "section.air3-card-section",  # Current Upwork card style
-        "section.up-card-section",
-        'div[class*="job-tile"]',
-    ]
-
     tiles = []
-    for selector in tile_selectors:
-        tiles = soup.select(selector)
+    for selector in JOB_TILE_SELECTORS:
+        tiles = _select(tree, selector)
         if tiles:
-            logger.info(f"[PARSER] Found {len(tiles)} tiles with selector: {selector}")
+            logger.info("[PARSER] Found %d tiles with selector: %s", len(tiles), selector)
             break
 
     if not tiles:
         # Log what data-test attributes ARE on the page (helps discover new selectors)
         logger.warning("[PARSER] No tiles matched any known selector.")
-        data_test_els = soup.find_all(attrs={"data-test": True})
-        data_test_values = sorted(set(el["data-test"] for el in data_test_els[:50]))
-        if data_test_values:
-            logger.info(f"[PARSER] data-test attrs on page: {data_test_values}")
-        else:
-            logger.warning("[PARSER] No data-test attributes found — page may not be Upwork content")
+        if logger.isEnabledFor(logging.INFO):
+            data_test_els = _select(tree, "[data-test]")
+            data_test_values = sorted(set(_attr(el, "data-test") for el in data_test_els[:50]))
+            if data_test_values:
+                logger.info("[PARSER] data-test attrs on page: %s", data_test_values)
+            else:
+                logger.warning("[PARSER] No data-test attributes found — page may not be Upwork content")
 
         # Last resort: look for any links to job detail pages
         # URL format: /jobs/Title_~0ID/ or /jobs/~0ID or /details/~0ID
-        links = soup.find_all("a", href=re.compile(r"/jobs/.*~|/details/.*~"))
-        logger.info(f"[PARSER] Fallback: found {len(links)} links to job pages")
+        links = [a for a in _select(tree, "a[href]") if _JOB_LINK_RE.search(_attr(a, "href"))]
+        logger.info("[PARSER] Fallback: found %d links to job pages", len(links))
         seen = set()
         for link in links:
-            href = link.get("href", "")
+            href = _attr(link, "href")
             job_id = _extract_job_id_from_url(href)
             if job_id and job_id not in seen:
+                if limit and len(jobs) >= limit:
+                    break
                 seen.add(job_id)
-                url = urljoin(UPWORK_BASE, href)
+                url = _absolute_url(href)
                 jobs.append({
                     "id": job_id,
                     "url": url,
-                    "title": _clean_text(link.get_text()),
+                    "title": _clean_text(_text(link)),
                     "source": source,
                 })
-        logger.info(f"[PARSER] Fallback extracted {len(jobs)} unique jobs from links")
+        logger.info("[PARSER] Fallback extracted %d unique jobs from links", len(jobs))
         return jobs
 
     for tile in tiles:
+        if limit and len(jobs) >= limit:
+            break
         job_data = _parse_single_tile(tile, source)
         if job_data:
             jobs.append(job_data)
@@ -207,32 +362,26 @@ def parse_job_tiles_from_html(html: str, source: str = "best_matches") -> list[d
     return jobs
 
 
-def _parse_single_tile(tile: Tag, source: str) -> Optional[dict]:
+def _parse_single_tile(tile: Node, source: str) -> Optional[dict]:
     """Parse a single job tile element into a dict."""
     # Find the title link
     title_link = None
-    for selector in [
-        '[data-test="job-tile-title"] a',
-        '[data-test="UpLink"] ',
-        "h2 a",
-        "h3 a",
-        'a[href*="/jobs/"][href*="~"]',  # Matches /jobs/Title_~0ID/ and /jobs/~0ID
-        'a[href*="/details/"][href*="~"]',
-    ]:
-        title_link = tile.select_one(selector)
+    for selector in JOB_TILE_TITLE_SELECTORS:
+        title_link = _select_one(tile, selector)
         if title_link:
             break
 
     if not title_link:
         return None
 
-    href = title_link.get("href", "")
+    href = _attr(title_link, "href")
     job_id = _extract_job_id_from_url(href)
     if not job_id:
         return None
 
-    url = urljoin(UPWORK_BASE, href)
-    title = _clean_text(title_link.get_text())
+    url = _absolute_url(href)
+    title = _clean_text(_text(title_link))
+    by_test = _index_by_attr(tile, "data-test")
 
     # Extract additional info from tile if available
     data = {
@@ -244,26 +393,26 @@ def _parse_single_tile(tile: Tag, source: str) -> Optional[dict]:
 
     # Try to get description snippet
     desc_el = (
-        tile.select_one('[data-test="job-description-text"]')
-        or tile.select_one('[data-test="job-description-line-clamp"]')
-        or tile.select_one('p[class*="description"]')
+        by_test.get("job-description-text")
+        or by_test.get("job-description-line-clamp")
+        or _select_one(tile, 'p[class*="description"]')
     )
     if desc_el:
-        data["description"] = _clean_text(desc_el.get_text())
+        data["description"] = _clean_text(_text(desc_el))
 
     # Try to get budget / job type (new: data-test="job-type" with "Hourly: $30-$45" or "Fixed: $500")
     budget_el = (
-        tile.select_one('[data-test="job-type"]')
-        or tile.select_one('[data-test="job-budget"]')
-        or tile.select_one('[data-test="budget"]')
-        or tile.select_one('span[class*="budget"]')
+        by_test.get("job-type")
+        or by_test.get("job-budget")
+        or by_test.get("budget")
+        or _select_one(tile, 'span[class*="budget"]')
     )
     if budget_el:
-        budget_text = _clean_text(budget_el.get_text())
+        budget_text = _clean_text(_text(budget_el))
         data["budget_amount"] = _parse_money(budget_text)
         if "hourly" in budget_text.lower() or "/hr" in budget_text.lower():
             data["budget_type"] = "hourly"
-            range_match = re.search(r"\$([\d,.]+)\s*[-–]\s*\$([\d,.]+)", budget_text)
+            range_match = _RATE_RANGE_RE.search(budget_text)
             if range_match:
                 data["hourly_rate_min"] = float(range_match.group(1).replace(",", ""))
                 data["hourly_rate_max"] = float(range_match.group(2).replace(",", ""))
@@ -271,33 +420,31 @@ def _parse_single_tile(tile: Tag, source: str) -> Optional[dict]:
             data["budget_type"] = "fixed"
 
     # Try to get skills (new: a[data-test="attr-item"] or .air3-token)
-    skill_tags = (
-        tile.select('a[data-test="attr-item"]')
-        or tile.select('[data-test="token-container"] a')
-        or tile.select(".air3-token")
-        or tile.select('[data-test="TokenClamp"] .air3-token')
-        or tile.select('span[class*="skill"]')
-    )
+    skill_tags = []
+    for selector in JOB_TILE_SKILL_SELECTORS:
+        skill_tags = _select(tile, selector)
+        if skill_tags:
+            break
     if skill_tags:
-        data["skills"] = [_clean_text(s.get_text()) for s in skill_tags if s.get_text().strip()]
+        data["skills"] = [_clean_text(_text(s)) for s in skill_tags if _text(s).strip()]
 
     # Try to get experience level (new: data-test="contractor-tier")
     exp_el = (
-        tile.select_one('[data-test="contractor-tier"]')
-        or tile.select_one('[data-test="experience-level"]')
+        by_test.get("contractor-tier")
+        or by_test.get("experience-level")
     )
     if exp_el:
-        data["experience_level"] = _clean_text(exp_el.get_text())
+        data["experience_level"] = _clean_text(_text(exp_el))
 
     # Try to get proposals count
-    proposals_el = tile.select_one('[data-test="proposals"]')
+    proposals_el = by_test.get("proposals")
     if proposals_el:
-        data["proposals_count"] = _parse_int(proposals_el.get_text())
+        data["proposals_count"] = _parse_int(_text(proposals_el))
 
     # Try to get posted date
-    posted_el = tile.select_one('[data-test="posted-on"]') or tile.select_one("time")
+    posted_el = by_test.get("posted-on") or _select_one(tile, "time")
     if posted_el:
-        data["posted_date"] = _clean_text(posted_el.get_text()) or posted_el.get("datetime", "")
+        data["posted_date"] = _clean_text(_text(posted_el)) or _attr(posted_el, "datetime")
 
     return data
 
@@ -305,57 +452,63 @@ def _parse_single_tile(tile: Tag, source: str) -> Optional[dict]:
 # ── Job Detail Page Parser ───────────────────────────────────────────────────
 
 
-def parse_job_detail(html: str, job_url: str = "") -> Job:
+def parse_job_detail(html: str, job_url: str = "", keep_raw_html: bool = False) -> Job:
     """Parse a complete job detail page into a Job model.
 
-    Tries NUXT data first, falls back to HTML selectors.
+    Tries NUXT data first, falls back to HTML selectors. The page HTML is
+    only copied into ``Job.raw_html`` when ``keep_raw_html`` is set; it is
+    several hundred KB per job and nothing reads it back by default.
     """
-    logger.info(f"[PARSER] parse_job_detail: url={job_url}, html_size={len(html)} chars")
-    soup = BeautifulSoup(html, "html.parser")
+    logger.info("[PARSER] parse_job_detail: url=%s, html_size=%d chars", job_url, len(html))
+    tree = _parse_html(html)
     job_id = _extract_job_id_from_url(job_url) or ""
 
     data: dict[str, Any] = {
         "id": job_id,
         "url": job_url,
-        "raw_html": html,
     }
+    if keep_raw_html:
+        data["raw_html"] = html
 
     # Strategy 1: Try NUXT data
-    nuxt = _parse_nuxt_data(html)
+    nuxt = _parse_nuxt_data(html, tree)
     if nuxt:
         nuxt_data = _extract_from_nuxt(nuxt)
         nuxt_fields = {k: v for k, v in nuxt_data.items() if v}
         data.update(nuxt_fields)
-        logger.info(f"[PARSER] NUXT extracted {len(nuxt_fields)} fields: {list(nuxt_fields.keys())}")
+        logger.info("[PARSER] NUXT extracted %d fields: %s", len(nuxt_fields), list(nuxt_fields))
     else:
         logger.info("[PARSER] No __NUXT_DATA__ found, skipping NUXT strategy")
 
     # Strategy 2: HTML selectors (fill in gaps)
-    html_data = _extract_from_html(soup)
+    needed = {name for name in Job.model_fields if not data.get(name)}
+    html_data = _extract_from_html(tree, needed)
     html_added = 0
     for key, value in html_data.items():
         if value and not data.get(key):
             data[key] = value
             html_added += 1
-    logger.info(f"[PARSER] HTML selectors: found {len(html_data)} fields, added {html_added} new")
+    logger.info("[PARSER] HTML selectors: found %d fields, added %d new", len(html_data), html_added)
 
     # Strategy 3: Meta tags (last resort)
-    meta_data = _extract_from_meta(soup)
+    needed = {name for name in needed if not data.get(name)}
+    meta_data = _extract_from_meta(tree, needed)
     meta_added = 0
     for key, value in meta_data.items():
         if value and not data.get(key):
             data[key] = value
             meta_added += 1
     if meta_added:
-        logger.info(f"[PARSER] Meta tags: added {meta_added} fields")
+        logger.info("[PARSER] Meta tags: added %d fields", meta_added)
 
     # Ensure required fields
     if not data.get("title"):
         data["title"] = "Unknown Job"
-        logger.warning(f"[PARSER] No title found for {job_url} — all strategies failed")
+        logger.warning("[PARSER] No title found for %s — all strategies failed", job_url)
 
-    final_fields = [k for k, v in data.items() if v and k not in ("raw_html", "id", "url")]
-    logger.info(f"[PARSER] Final job '{data.get('title', '?')[:50]}' has fields: {final_fields}")
+    if logger.isEnabledFor(logging.INFO):
+        final_fields = [k for k, v in data.items() if v and k not in ("raw_html", "id", "url")]
+        logger.info("[PARSER] Final job '%s' has fields: %s", data["title"][:50], final_fields)
 
     return Job(**data)
 
@@ -367,85 +520,142 @@ def _extract_from_nuxt(nuxt_data: list) -> dict[str, Any]:
     if not nuxt_data:
         return result
 
+    # Fields still without a value; dict searches stop once it is empty
+    remaining = set(_NUXT_FIELD_TARGETS)
+
     # If it's a single dict (from window.__NUXT__), search it directly
     if len(nuxt_data) == 1 and isinstance(nuxt_data[0], dict):
         flat = nuxt_data[0]
-        _search_dict_for_job_fields(flat, result)
+        _search_dict_for_job_fields(flat, result, remaining)
         return result
 
-    # For array-based NUXT data, search through all items
+    # For array-based NUXT data, index the key strings once instead of
+    # testing every item. A key's value is the item after its last
+    # occurrence, which overwrites whatever the dict searches found before it
+    # (the final item has no value, so it is never a key).
+    key_idx = {item: i for i, item in enumerate(nuxt_data[:-1]) if isinstance(item, str)}
+    last_idx: dict[str, int] = {}
+    for key, field in _NUXT_ARRAY_KEY_MAP.items():
+        i = key_idx.get(key)
+        if i is not None and i > last_idx.get(field, -1):
+            last_idx[field] = i
+    assignments = sorted((i, field) for field, i in last_idx.items())
+
+    def _assign(i: int, field: str):
+        next_val = nuxt_data[i + 1]
+        if isinstance(next_val, int) and next_val < len(nuxt_data):
+            value = _resolve_nuxt_value(nuxt_data, next_val)
+        else:
+            value = next_val
+        # These overwrite unconditionally, so may also empty a field
+        result[field] = value
+        if value:
+            remaining.discard(field)
+        else:
+            remaining.add(field)
+
+    pending = 0
     for i, item in enumerate(nuxt_data):
         if isinstance(item, dict):
-            _search_dict_for_job_fields(item, result)
-        elif isinstance(item, str):
-            # Look for key names that map to job fields
-            key_map = {
-                "title": "title",
-                "description": "description",
-                "skills": "skills",
-                "duration": "duration",
-                "budget": "budget_amount",
-                "hourlyBudgetMin": "hourly_rate_min",
-                "hourlyBudgetMax": "hourly_rate_max",
-                "amount": "budget_amount",
-                "contractorTier": "experience_level",
-                "publishedOn": "posted_date",
-                "clientCountry": "client_country",
-            }
-            if item in key_map and i + 1 < len(nuxt_data):
-                next_val = nuxt_data[i + 1]
-                if isinstance(next_val, int) and next_val < len(nuxt_data):
-                    result[key_map[item]] = _resolve_nuxt_value(nuxt_data, next_val)
-                else:
-                    result[key_map[item]] = next_val
+            while pending < len(assignments) and assignments[pending][0] < i:
+                _assign(*assignments[pending])
+                pending += 1
+            if remaining:
+                _search_dict_for_job_fields(item, result, remaining)
+    for assignment in assignments[pending:]:
+        _assign(*assignment)
 
     return result
 
 
-def _search_dict_for_job_fields(d: dict, result: dict):
-    """Recursively search a dict for job-related fields."""
-    field_map = {
-        "title": "title",
-        "jobTitle": "title",
-        "description": "description",
-        "jobDescription": "description",
-        "skills": "skills",
-        "duration": "duration",
-        "durationLabel": "duration",
-        "budget": "budget_amount",
-        "amount": "budget_amount",
-        "hourlyBudgetMin": "hourly_rate_min",
-        "hourlyBudgetMax": "hourly_rate_max",
-        "contractorTier": "experience_level",
-        "tierLabel": "experience_level",
-        "publishedOn": "posted_date",
-        "createdOn": "posted_date",
-        "clientCountry": "client_country",
-        "country": "client_country",
-        "city": "client_city",
-        "totalSpent": "client_total_spent",
-        "totalHires": "client_hires",
-        "openJobs": "client_active_jobs",
-        "postedJobCount": "client_jobs_posted",
-        "score": "client_rating",
-        "paymentVerificationStatus": "payment_verified",
-        "proposalCount": "proposals_count",
-        "inviteCount": "invites_sent",
-        "interviewCount": "interviewing_count",
-        "connectPrice": "connects_required",
-        "categoryName": "category",
-        "subcategoryName": "subcategory",
+# Key names in the flat NUXT array -> Job fields (value is the next item)
+_NUXT_ARRAY_KEY_MAP = {
+    "title": "title",
+    "description": "description",
+    "skills": "skills",
+    "duration": "duration",
+    "budget": "budget_amount",
+    "hourlyBudgetMin": "hourly_rate_min",
+    "hourlyBudgetMax": "hourly_rate_max",
+    "amount": "budget_amount",
+    "contractorTier": "experience_level",
+    "publishedOn": "posted_date",
+    "clientCountry": "client_country",
+}
+
+# NUXT/state keys -> Job fields
+_NUXT_FIELD_MAP = {
+    "title": "title",
+    "jobTitle": "title",
+    "description": "description",
+    "jobDescription": "description",
+    "skills": "skills",
+    "duration": "duration",
+    "durationLabel": "duration",
+    "budget": "budget_amount",
+    "amount": "budget_amount",
+    "hourlyBudgetMin": "hourly_rate_min",
+    "hourlyBudgetMax": "hourly_rate_max",
+    "contractorTier": "experience_level",
+    "tierLabel": "experience_level",
+    "publishedOn": "posted_date",
+    "createdOn": "posted_date",
+    "clientCountry": "client_country",
+    "country": "client_country",
+    "city": "client_city",
+    "totalSpent": "client_total_spent",
+    "totalHires": "client_hires",
+    "openJobs": "client_active_jobs",
+    "postedJobCount": "client_jobs_posted",
+    "score": "client_rating",
+    "paymentVerificationStatus": "payment_verified",
+    "proposalCount": "proposals_count",
+    "inviteCount": "invites_sent",
+    "interviewCount": "interviewing_count",
+    "connectPrice": "connects_required",
+    "categoryName": "category",
+    "subcategoryName": "subcategory",
+}
+_NUXT_FIELD_TARGETS = frozenset(_NUXT_FIELD_MAP.values())
+# Fields filled from one budget element (NUXT or HTML)
+_BUDGET_FIELDS = frozenset({"budget_amount", "budget_type", "hourly_rate_min", "hourly_rate_max"})
+_MONEY_FIELDS = frozenset(
+    {"budget_amount", "hourly_rate_min", "hourly_rate_max", "client_total_spent", "client_rating"}
+)
+_INT_FIELDS = frozenset(
+    {
+        "client_hires",
+        "client_active_jobs",
+        "client_jobs_posted",
+        "proposals_count",
+        "invites_sent",
+        "interviewing_count",
+        "connects_required",
     }
+)
 
-    for key, value in d.items():
-        if key in field_map and value is not None:
-            target = field_map[key]
-            if target not in result or not result[target]:
+
+def _search_dict_for_job_fields(d: dict, result: dict, remaining: set[str]):
+    """Search a dict and everything nested in it for job-related fields.
+
+    Walks depth-first in document order (the first non-empty value for a
+    field wins) using an explicit stack of item iterators, so large NUXT
+    payloads don't cost a Python call per nested dict. ``remaining`` holds
+    the fields still unset; fields are removed as they fill and the walk
+    stops as soon as none are left.
+    """
+    if not remaining:
+        return
+    stack = [iter(d.items())]
+    while stack:
+        for key, value in stack[-1]:
+            target = _NUXT_FIELD_MAP.get(key)
+            if target is not None and value is not None and not result.get(target):
                 if target == "payment_verified":
                     result[target] = value == 1 or value == "verified" or value is True
-                elif target in ("budget_amount", "hourly_rate_min", "hourly_rate_max", "client_total_spent", "client_rating"):
+                elif target in _MONEY_FIELDS:
                     result[target] = _parse_money(str(value)) if isinstance(value, str) else value
-                elif target in ("client_hires", "client_active_jobs", "client_jobs_posted", "proposals_count", "invites_sent", "interviewing_count", "connects_required"):
+                elif target in _INT_FIELDS:
                     result[target] = _parse_int(str(value)) if isinstance(value, str) else value
                 elif target == "skills" and isinstance(value, list):
                     result[target] = [
@@ -453,43 +663,60 @@ def _search_dict_for_job_fields(d: dict, result: dict):
                     ]
                 else:
                     result[target] = value
+                if result[target]:
+                    remaining.discard(target)
+                    if not remaining:
+                        return
+
+            # Descend into nested dicts before moving on to the next key
+            if isinstance(value, dict):
+                stack.append(iter(value.items()))
+                break
+            if isinstance(value, list):
+                nested = [item for item in value if isinstance(item, dict)]
+                if nested:
+                    stack.append(chain.from_iterable(item.items() for item in nested))
+                    break
+        else:
+            stack.pop()
 
-        # Recurse into nested dicts
-        if isinstance(value, dict):
-            _search_dict_for_job_fields(value, result)
-        elif isinstance(value, list):
-            for item in value:
-                if isinstance(item, dict):
-                    _search_dict_for_job_fields(item, result)
 
+def _extract_from_html(tree: Node, needed: set[str]) -> dict[str, Any]:
+    """Extract job fields from HTML elements using CSS selectors.
 
-def _extract_from_html(soup: BeautifulSoup) -> dict[str, Any]:
-    """Extract job fields from HTML elements using CSS selectors."""
+    Only looks up the fields in ``needed`` (those still empty after NUXT).
+    """
     result: dict[str, Any] = {}
+    if not needed:
+        return result
+    by_test = _index_by_attr(tree, "data-test")
+    by_qa = _index_by_attr(tree, "data-qa")
 
     # Title
-    for sel in ['[data-test="job-title"]', "h1", '[data-test="JobTitle"]']:
-        el = soup.select_one(sel)
+    if "title" in needed:
+        el = by_test.get("job-title") or _select_one(tree, "h1") or by_test.get("JobTitle")
         if el:
-            result["title"] = _clean_text(el.get_text())
-            break
+            result["title"] = _clean_text(_text(el))
 
     # Description
-    for sel in ['[data-test="Description"]', '[data-test="job-description"]', ".job-description"]:
-        el = soup.select_one(sel)
+    if "description" in needed:
+        el = (
+            by_test.get("Description")
+            or by_test.get("job-description")
+            or _select_one(tree, ".job-description")
+        )
         if el:
-            result["description"] = _clean_text(el.get_text())
-            break
+            result["description"] = _clean_text(_text(el))
 
     # Budget
-    el = soup.select_one('[data-test="job-budget"]') or soup.select_one('[data-test="Budget"]')
-    if el:
-        text = _clean_text(el.get_text())
+    el = by_test.get("job-budget") or by_test.get("Budget")
+    if el and not needed.isdisjoint(_BUDGET_FIELDS):
+        text = _clean_text(_text(el))
         result["budget_amount"] = _parse_money(text)
         if "/hr" in text.lower():
             result["budget_type"] = "hourly"
             # Try to extract range
-            range_match = re.search(r"\$([\d,.]+)\s*[-–]\s*\$([\d,.]+)", text)
+            range_match = _RATE_RANGE_RE.search(text)
             if range_match:
                 result["hourly_rate_min"] = float(range_match.group(1).replace(",", ""))
                 result["hourly_rate_max"] = float(range_match.group(2).replace(",", ""))
@@ -497,79 +724,86 @@ def _extract_from_html(soup: BeautifulSoup) -> dict[str, Any]:
             result["budget_type"] = "fixed"
 
     # Skills
-    skill_els = soup.select('[data-test="TokenClamp"] .air3-token') or soup.select(
-        'a[data-test="attr-item"]'
-    )
-    if skill_els:
-        result["skills"] = [_clean_text(s.get_text()) for s in skill_els if s.get_text().strip()]
+    if "skills" in needed:
+        skill_els = _select(tree, '[data-test="TokenClamp"] .air3-token') or _select(
+            tree, 'a[data-test="attr-item"]'
+        )
+        if skill_els:
+            result["skills"] = [_clean_text(_text(s)) for s in skill_els if _text(s).strip()]
 
     # Experience level
-    el = soup.select_one('[data-test="experience-level"]')
-    if el:
-        result["experience_level"] = _clean_text(el.get_text())
+    el = by_test.get("experience-level")
+    if el and "experience_level" in needed:
+        result["experience_level"] = _clean_text(_text(el))
 
     # Duration
-    el = soup.select_one('[data-test="duration"]')
-    if el:
-        result["duration"] = _clean_text(el.get_text())
+    el = by_test.get("duration")
+    if el and "duration" in needed:
+        result["duration"] = _clean_text(_text(el))
 
     # Workload
-    el = soup.select_one('[data-test="workload"]')
-    if el:
-        result["weekly_hours"] = _clean_text(el.get_text())
+    el = by_test.get("workload")
+    if el and "weekly_hours" in needed:
+        result["weekly_hours"] = _clean_text(_text(el))
 
     # Client info
-    el = soup.select_one('[data-qa="client-location"]')
-    if el:
-        result["client_country"] = _clean_text(el.get_text())
+    el = by_qa.get("client-location")
+    if el and "client_country" in needed:
+        result["client_country"] = _clean_text(_text(el))
 
-    el = soup.select_one('[data-qa="client-spend"]')
-    if el:
-        result["client_total_spent"] = _parse_money(el.get_text())
+    el = by_qa.get("client-spend")
+    if el and "client_total_spent" in needed:
+        result["client_total_spent"] = _parse_money(_text(el))
 
-    el = soup.select_one('[data-qa="client-hires"]')
-    if el:
-        result["client_hires"] = _parse_int(el.get_text())
+    el = by_qa.get("client-hires")
+    if el and "client_hires" in needed:
+        result["client_hires"] = _parse_int(_text(el))
 
-    el = soup.select_one('[data-qa="client-rating"]')
-    if el:
-        rating_text = _clean_text(el.get_text())
+    el = by_qa.get("client-rating")
+    if el and "client_rating" in needed:
+        rating_text = _clean_text(_text(el))
         result["client_rating"] = _parse_money(rating_text)
 
     # Proposals
-    el = soup.select_one('[data-test="proposals"]')
-    if el:
-        result["proposals_count"] = _parse_int(el.get_text())
+    el = by_test.get("proposals")
+    if el and "proposals_count" in needed:
+        result["proposals_count"] = _parse_int(_text(el))
 
     # Connects
-    el = soup.select_one('[data-test="connects"]')
-    if el:
-        result["connects_required"] = _parse_int(el.get_text())
+    el = by_test.get("connects")
+    if el and "connects_required" in needed:
+        result["connects_required"] = _parse_int(_text(el))
 
     # Posted date
-    el = soup.select_one('[data-test="posted-on"]') or soup.select_one("time")
-    if el:
-        result["posted_date"] = _clean_text(el.get_text()) or el.get("datetime", "")
+    if "posted_date" in needed:
+        el = by_test.get("posted-on") or _select_one(tree, "time")
+        if el:
+            result["posted_date"] = _clean_text(_text(el)) or _attr(el, "datetime")
 
     return result
 
 
-def _extract_from_meta(soup: BeautifulSoup) -> dict[str, Any]:
-    """Extract job info from meta tags as last resort."""
+def _extract_from_meta(tree: Node, needed: set[str]) -> dict[str, Any]:
+    """Extract job info from meta tags as last resort.
+
+    Only looks up the fields in ``needed``.
+    """
     result: dict[str, Any] = {}
 
-    meta_desc = soup.find("meta", attrs={"name": "description"})
-    if meta_desc and meta_desc.get("content"):
-        result["description"] = meta_desc["content"]
+    if "description" in needed:
+        meta_desc = _select_one(tree, 'meta[name="description"]')
+        if meta_desc and _attr(meta_desc, "content"):
+            result["description"] = _attr(meta_desc, "content")
 
-    og_title = soup.find("meta", attrs={"property": "og:title"})
-    if og_title and og_title.get("content"):
-        result["title"] = og_title["content"]
+    if "title" in needed:
+        og_title = _select_one(tree, 'meta[property="og:title"]')
+        if og_title and _attr(og_title, "content"):
+            result["title"] = _attr(og_title, "content")
 
-    og_url = soup.find("meta", attrs={"property": "og:url"})
-    if og_url and og_url.get("content"):
-        result["url"] = og_url["content"]
+    og_url = _select_one(tree, 'meta[property="og:url"]') if {"url", "id"} & needed else None
+    if og_url and _attr(og_url, "content"):
+        result["url"] = _attr(og_url, "content")
         if not result.get("id"):
-            result["id"] = _extract_job_id_from_url(og_url["content"])
+            result["id"] = _extract_job_id_from_url(result["url"])
 
     return result
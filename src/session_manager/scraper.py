@@ -4,13 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import sys
-from typing import Optional
+from typing import AsyncIterator, Optional
 from urllib.parse import urlencode
 
 import httpx
 
-from ..config import DEFAULT_MAX_JOBS, MAX_CONCURRENT_REQUESTS, REQUEST_DELAY_MS
+try:
+    import h2  # noqa: F401  (enables httpx's HTTP/2 support)
+
+    _HTTP2 = True
+except ImportError:  # optional "speedups" extra
+    _HTTP2 = False
+
+from ..config import DEFAULT_MAX_JOBS, LOG_LEVEL, MAX_CONCURRENT_REQUESTS, REQUEST_DELAY_MS
 from ..constants import UPWORK_BASE, UPWORK_BEST_MATCHES_URL, UPWORK_SEARCH_URL
 from ..models.job import Job, SearchParams
 from .parser import parse_job_detail, parse_job_tiles_from_html
@@ -20,75 +28,129 @@ if not logger.handlers:
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s"))
     logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(LOG_LEVEL)
+
+
+# Browser-like headers sent with every request (User-Agent is added per scraper)
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# One pooled connection per concurrent request; over HTTP/2 the detail
+# fetches share a single connection as multiplexed streams
+_LIMITS = httpx.Limits(
+    max_connections=MAX_CONCURRENT_REQUESTS,
+    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+    keepalive_expiry=30.0,
+)
+
+# Retry waits grow exponentially from these bases (seconds), capped at
+# _MAX_BACKOFF_S, plus up to one base of random jitter so parallel fetches
+# that hit a 429 together don't all retry at the same instant
+_RATE_LIMIT_BACKOFF_S = 5.0
+_RETRY_BACKOFF_S = 2.0
+_MAX_BACKOFF_S = 60.0
+
+
+def _backoff(attempt: int, base: float) -> float:
+    """Return the jittered exponential wait before retry ``attempt + 1``."""
+    return min(_MAX_BACKOFF_S, base * 2**attempt) + random.uniform(0, base)
 
 
 class UpworkScraper:
-    """Scrapes Upwork using HTTP requests with stolen browser session cookies."""
+    """Scrapes Upwork using HTTP requests with stolen browser session cookies.
+
+    ``cookies`` is either the browser's cookie list or a ready name -> value
+    map such as ``BrowserSession.cookie_map``. Pass a long-lived ``client`` to reuse its connection pool (and TLS
+    sessions) across scrapers; it is left open on exit. Without one, a
+    client is created and closed per ``async with`` block.
+    """
 
-    def __init__(self, cookies: list[dict], user_agent: str):
-        self._cookies = {c["name"]: c["value"] for c in cookies if "name" in c and "value" in c}
+    def __init__(
+        self,
+        cookies: list[dict] | dict[str, str],
+        user_agent: str,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        if isinstance(cookies, dict):
+            # Already a name -> value map (e.g. BrowserSession.cookie_map); no copy
+            self._cookies = cookies
+        else:
+            self._cookies = {c["name"]: c["value"] for c in cookies if "name" in c and "value" in c}
         self._user_agent = user_agent
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
         self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     async def __aenter__(self):
-        logger.info(f"[SCRAPER] Initializing httpx client with {len(self._cookies)} cookies")
-        logger.info(f"[SCRAPER] Cookie names: {list(self._cookies.keys())[:10]}...")
-        self._client = httpx.AsyncClient(
-            cookies=self._cookies,
-            headers={
-                "User-Agent": self._user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            },
-            follow_redirects=True,
-            timeout=30.0,
-        )
+        logger.info("[SCRAPER] Initializing httpx client with %d cookies", len(self._cookies))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[SCRAPER] Cookie names: %s...", list(self._cookies)[:10])
+        headers = {"User-Agent": self._user_agent, **_BASE_HEADERS}
+        if self._owns_client:
+            self._client = httpx.AsyncClient(
+                cookies=self._cookies,
+                headers=headers,
+                follow_redirects=True,
+                timeout=30.0,
+                http2=_HTTP2,
+                limits=_LIMITS,
+            )
+        else:
+            # Shared client: refresh it with this session's identity
+            self._client.cookies.update(self._cookies)
+            self._client.headers.update(headers)
         return self
 
     async def __aexit__(self, *args):
-        if self._client:
+        if self._owns_client and self._client:
             await self._client.aclose()
+            self._client = None
 
     async def _fetch_page(self, url: str) -> str:
-        """Fetch a single page with rate limiting and retry."""
-        async with self._semaphore:
-            for attempt in range(3):
-                try:
+        """Fetch a single page with rate limiting and retry.
+
+        Only the request itself holds a concurrency slot; the politeness delay
+        and retry backoff sleep outside the semaphore.
+        """
+        for attempt in range(3):
+            try:
+                async with self._semaphore:
                     response = await self._client.get(url)
+                if logger.isEnabledFor(logging.INFO):
+                    # response.text decodes the whole body; only pay for it when logged
                     logger.info(
-                        f"[SCRAPER] _fetch_page: status={response.status_code}, "
-                        f"url={response.url}, size={len(response.text)} chars "
-                        f"(attempt {attempt + 1})"
+                        "[SCRAPER] _fetch_page: status=%d, url=%s, size=%d chars (attempt %d)",
+                        response.status_code, response.url, len(response.text), attempt + 1,
                     )
 
-                    # Check for login redirect (session expired)
-                    if response.status_code == 302 or "/login" in str(response.url):
-                        logger.warning(f"[SCRAPER] Redirected to login! URL: {response.url}")
-                        raise RuntimeError("Session expired - redirected to login.")
-
-                    response.raise_for_status()
-                    await asyncio.sleep(REQUEST_DELAY_MS / 1000)
-                    return response.text
-
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 429:
-                        wait = (attempt + 1) * 5
-                        logger.warning(f"Rate limited (429), waiting {wait}s...")
-                        await asyncio.sleep(wait)
-                    elif e.response.status_code >= 500:
-                        logger.warning(f"Server error {e.response.status_code}, retrying...")
-                        await asyncio.sleep(2)
-                    else:
-                        logger.error(f"[SCRAPER] HTTP {e.response.status_code} for {url}")
-                        raise
-                except httpx.ConnectError as e:
-                    logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
-                    await asyncio.sleep(2)
+                # Check for login redirect (session expired)
+                if response.status_code == 302 or "/login" in str(response.url):
+                    logger.warning("[SCRAPER] Redirected to login! URL: %s", response.url)
+                    raise RuntimeError("Session expired - redirected to login.")
+
+                response.raise_for_status()
+                await asyncio.sleep(REQUEST_DELAY_MS / 1000)
+                return response.text
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
+                    wait = _backoff(attempt, _RATE_LIMIT_BACKOFF_S)
+                    logger.warning("Rate limited (429), waiting %.1fs...", wait)
+                    await asyncio.sleep(wait)
+                elif e.response.status_code >= 500:
+                    logger.warning("Server error %d, retrying...", e.response.status_code)
+                    await asyncio.sleep(_backoff(attempt, _RETRY_BACKOFF_S))
+                else:
+                    logger.error("[SCRAPER] HTTP %d for %s", e.response.status_code, url)
+                    raise
+            except httpx.ConnectError as e:
+                logger.warning("Connection error on attempt %d: %s", attempt + 1, e)
+                await asyncio.sleep(_backoff(attempt, _RETRY_BACKOFF_S))
 
         raise RuntimeError(f"Failed to fetch {url} after 3 attempts.")
 
@@ -114,16 +176,13 @@ class UpworkScraper:
             logger.info("Fetching Best Matches via HTTP (limited without JS)...")
             html = await self._fetch_page(UPWORK_BEST_MATCHES_URL)
 
-        # Extract job URLs from the list page
-        tiles = parse_job_tiles_from_html(html, source="best_matches")
-        logger.info(f"Found {len(tiles)} job tiles on Best Matches page.")
-
-        # Limit the number of jobs to fetch details for
-        tiles = tiles[:max_jobs]
+        # Extract job URLs from the list page, stopping after max_jobs tiles
+        tiles = await asyncio.to_thread(parse_job_tiles_from_html, html, "best_matches", max_jobs)
+        logger.info("Found %d job tiles on Best Matches page.", len(tiles))
 
         # Fetch full details for each job in parallel
-        jobs = await self._fetch_job_details_batch([t["url"] for t in tiles], source="best_matches")
-        return jobs
+        urls = [t["url"] for t in tiles]
+        return [job async for job in self._fetch_job_details_batch(urls, source="best_matches")]
 
     async def search_jobs(self, params: SearchParams) -> list[Job]:
         """Search for jobs with the given parameters.
@@ -136,21 +195,21 @@ class UpworkScraper:
         """
         url_params = params.to_url_params()
         search_url = f"{UPWORK_SEARCH_URL}?{urlencode(url_params)}"
-        logger.info(f"Searching: {search_url}")
+        logger.info("Searching: %s", search_url)
 
         html = await self._fetch_page(search_url)
-        tiles = parse_job_tiles_from_html(html, source="search")
-        logger.info(f"Found {len(tiles)} job tiles in search results.")
-
-        tiles = tiles[: params.max_results]
+        tiles = await asyncio.to_thread(
+            parse_job_tiles_from_html, html, "search", params.max_results
+        )
+        logger.info("Found %d job tiles in search results.", len(tiles))
 
         # Fetch full details
-        jobs = await self._fetch_job_details_batch(
+        batch = self._fetch_job_details_batch(
             [t["url"] for t in tiles],
             source="search",
             search_query=params.query,
         )
-        return jobs
+        return [job async for job in batch]
 
     async def fetch_job_detail(self, job_url: str, source: str = "") -> Job:
         """Fetch complete details for a single job.
@@ -165,7 +224,8 @@ class UpworkScraper:
             job_url = f"{UPWORK_BASE}/jobs/{job_url}"
 
         html = await self._fetch_page(job_url)
-        job = parse_job_detail(html, job_url)
+        # Parse off the event loop so the other concurrent fetches keep going
+        job = await asyncio.to_thread(parse_job_detail, html, job_url)
         if source:
             job.source = source
         return job
@@ -175,12 +235,17 @@ class UpworkScraper:
         urls: list[str],
         source: str = "",
         search_query: str = "",
-    ) -> list[Job]:
-        """Fetch full details for multiple jobs concurrently."""
+    ) -> AsyncIterator[Job]:
+        """Fetch full details for multiple jobs concurrently.
+
+        Yields each job as soon as its fetch completes (so in completion
+        order, not ``urls`` order); failed fetches are logged and skipped.
+        Fetches still in flight are cancelled if the consumer stops early.
+        """
         if not urls:
-            return []
+            return
 
-        logger.info(f"Fetching details for {len(urls)} jobs...")
+        logger.info("Fetching details for %d jobs...", len(urls))
 
         async def _fetch_one(url: str) -> Optional[Job]:
             try:
@@ -189,12 +254,19 @@ class UpworkScraper:
                     job.search_query = search_query
                 return job
             except Exception as e:
-                logger.warning(f"Failed to fetch {url}: {e}")
+                logger.warning("Failed to fetch %s: %s", url, e)
                 return None
 
-        tasks = [_fetch_one(url) for url in urls]
-        results = await asyncio.gather(*tasks)
-
-        jobs = [j for j in results if j is not None]
-        logger.info(f"Successfully fetched {len(jobs)}/{len(urls)} job details.")
-        return jobs
+        # Concurrency is bounded by self._semaphore inside _fetch_page
+        tasks = [asyncio.create_task(_fetch_one(url)) for url in urls]
+        fetched = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                job = await next_done
+                if job is not None:
+                    fetched += 1
+                    yield job
+        finally:
+            for task in tasks:
+                task.cancel()
+            logger.info("Successfully fetched %d/%d job details.", fetched, len(urls))
@@ -0,0 +1,47 @@
+"""Shared database access for the query and analysis tools."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiosqlite
+
+from ..database.connection import get_db, read_db
+from ..database.repository import JobRepository
+
+# Lock wait for the tools' own writes; they are best-effort, so give up long
+# before the 30s a scrape's writes wait
+_WRITE_BUSY_TIMEOUT_MS = 1000
+
+# One repository per pooled connection, reused across tool calls so its
+# per-shape query SQL cache stays warm
+_repos: dict[aiosqlite.Connection, JobRepository] = {}
+
+
+@asynccontextmanager
+async def _get_repo() -> AsyncIterator[JobRepository]:
+    """Check out a repository on a pooled read-only connection.
+
+    Concurrent tool calls each get their own connection, so their queries
+    run in parallel instead of queueing on one aiosqlite worker thread.
+    """
+    async with read_db() as db:
+        repo = _repos.get(db)
+        if repo is None:
+            repo = _repos[db] = JobRepository(db)
+        yield repo
+
+
+async def _get_write_repo() -> JobRepository:
+    """Get a repository on the shared read/write connection.
+
+    Only for the tools' own bookkeeping (e.g. the analysis cache); job data
+    is written by the Session Manager.
+    """
+    db = await get_db()
+    repo = _repos.get(db)
+    if repo is None:
+        await db.execute(f"PRAGMA busy_timeout={_WRITE_BUSY_TIMEOUT_MS}")
+        repo = _repos[db] = JobRepository(db)
+    return repo
@@ -0,0 +1,49 @@
+"""Markdown formatting shared by the job-listing tools."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+# One numbered entry of a job listing
+_JOB_TEMPLATE = (
+    "{index}. **{title}**\n"
+    "   Budget: {budget} | Level: {level} | {extra}\n"
+    "   Skills: {skills}\n"
+    "   URL: {url}\n"
+)
+
+
+def format_budget(
+    budget_amount: Optional[float],
+    hourly_rate_min: Optional[float],
+    hourly_rate_max: Optional[float],
+) -> str:
+    """Render a fixed budget or hourly range; empty when neither is known."""
+    if budget_amount:
+        return f"${budget_amount:,.0f}"
+    if hourly_rate_min:
+        return f"${hourly_rate_min}-${hourly_rate_max or '?'}/hr"
+    return ""
+
+
+def format_job_entry(
+    index: int,
+    title: str,
+    budget: str,
+    level: str,
+    extra: str,
+    skills: list[str],
+    url: str,
+    missing: str = "N/A",
+    no_skills: str = "None",
+) -> str:
+    """Render one listing entry, showing at most five skills."""
+    return _JOB_TEMPLATE.format(
+        index=index,
+        title=title,
+        budget=budget or missing,
+        level=level or "N/A",
+        extra=extra,
+        skills=", ".join(skills[:5]) or no_skills,
+        url=url,
+    )
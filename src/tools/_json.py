@@ -0,0 +1,14 @@
+"""JSON encoding for tool responses."""
+
+from __future__ import annotations
+
+import orjson
+
+
+def dumps(obj, pretty: bool = False) -> str:
+    """Serialize a tool result to a JSON string.
+
+    Compact by default: responses are read by the model, for which
+    indentation is only extra tokens. ``pretty`` indents by two spaces.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-import json
-from collections import Counter
+import asyncio
+import heapq
+import sqlite3
+from collections import Counter, OrderedDict
 
-import aiosqlite
+from ..models.job import JobSummary
+from ._db import _get_repo, _get_write_repo
+from ._json import dumps
 
-from ..config import DB_PATH
-from ..database.models import initialize_db
-from ..database.repository import JobRepository
+# Fixed-price budget buckets: amounts in [edge[i - 1], edge[i]) land in label[i]
+_BUDGET_BUCKET_EDGES = (100, 500, 1000, 5000, 10000)
+_BUDGET_BUCKET_LABELS = ("$0-$100", "$100-$500", "$500-$1K", "$1K-$5K", "$5K-$10K", "$10K+")
 
-
-async def _get_repo() -> tuple[aiosqlite.Connection, JobRepository]:
-    db = await aiosqlite.connect(str(DB_PATH))
-    db.row_factory = aiosqlite.Row
-    await initialize_db(db)
-    return db, JobRepository(db)
+# analyze_market_requirements results by (skill_focus, top_n), each stored
+# with the jobs version it was computed at; least recently used evicted first.
+# Backed by the analysis_cache table, which survives restarts.
+_ANALYSIS_CACHE: OrderedDict[tuple[str, int], tuple[str, str]] = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 32
+# Background analysis_cache writes, referenced so they aren't collected mid-write
+_pending_writes: set[asyncio.Task] = set()
 
 
 async def analyze_market_requirements(
@@ -38,92 +43,95 @@ async def analyze_market_requirements(
         JSON with market analysis: top skills, budget distribution,
         experience breakdown, job type split, and common requirements.
     """
-    db, repo = await _get_repo()
-    try:
-        # Get filtered jobs
-        jobs = await repo.query_jobs(
-            skills_contain=skill_focus,
-            limit=500,
-        )
-
-        if not jobs:
-            return json.dumps({
+    key = (skill_focus, top_n)
+    stored_key = f"market:{top_n}:{skill_focus}"
+    async with _get_repo() as repo:
+        version = await repo.jobs_version()
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            _ANALYSIS_CACHE.move_to_end(key)
+            return cached[1]
+
+        # Results persisted by an earlier server process are just as valid
+        result = await repo.get_cached_analysis(stored_key, version)
+        if result is None:
+            agg = await repo.aggregate_market(
+                skills_contain=skill_focus,
+                top_n=top_n,
+                budget_edges=_BUDGET_BUCKET_EDGES,
+                limit=500,
+            )
+
+    if result is None:
+        result = _format_market_analysis(agg, skill_focus)
+        if result is None:
+            return dumps({
                 "error": "No cached jobs found. Fetch some jobs first.",
                 "total_jobs_analyzed": 0,
             })
+        # Written in the background so a locked database never delays the reply
+        task = asyncio.create_task(_store_analysis(stored_key, version, result))
+        _pending_writes.add(task)
+        task.add_done_callback(_pending_writes.discard)
+
+    _ANALYSIS_CACHE[key] = (version, result)
+    _ANALYSIS_CACHE.move_to_end(key)
+    if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+        _ANALYSIS_CACHE.popitem(last=False)
+    return result
 
-        # Aggregate skills
-        skill_counter = Counter()
-        budget_amounts = []
-        hourly_rates_min = []
-        hourly_rates_max = []
-        experience_counts = Counter()
-        type_counts = Counter()
-        category_counter = Counter()
-
-        for job in jobs:
-            for skill in job.skills:
-                skill_counter[skill] += 1
-
-            if job.budget_amount and job.budget_amount > 0:
-                budget_amounts.append(job.budget_amount)
-            if job.hourly_rate_min and job.hourly_rate_min > 0:
-                hourly_rates_min.append(job.hourly_rate_min)
-            if job.hourly_rate_max and job.hourly_rate_max > 0:
-                hourly_rates_max.append(job.hourly_rate_max)
-
-            if job.experience_level:
-                experience_counts[job.experience_level] += 1
-
-            # Infer type from budget fields
-            if job.hourly_rate_min:
-                type_counts["hourly"] += 1
-            elif job.budget_amount:
-                type_counts["fixed"] += 1
-
-        total = len(jobs)
-
-        # Top skills
-        top_skills = [
-            {"skill": skill, "count": count, "percentage": round(count / total * 100, 1)}
-            for skill, count in skill_counter.most_common(top_n)
-        ]
-
-        # Budget distribution
-        budget_buckets = [
-            ("$0-$100", 0, 100),
-            ("$100-$500", 100, 500),
-            ("$500-$1K", 500, 1000),
-            ("$1K-$5K", 1000, 5000),
-            ("$5K-$10K", 5000, 10000),
-            ("$10K+", 10000, float("inf")),
-        ]
-        budget_dist = []
-        for label, low, high in budget_buckets:
-            count = sum(1 for b in budget_amounts if low <= b < high)
-            if count > 0:
-                budget_dist.append({
-                    "range": label,
-                    "count": count,
-                    "percentage": round(count / max(len(budget_amounts), 1) * 100, 1),
-                })
-
-        analysis = {
-            "total_jobs_analyzed": total,
-            "skill_focus": skill_focus or "all",
-            "top_skills": top_skills,
-            "budget_distribution": budget_dist,
-            "experience_breakdown": dict(experience_counts),
-            "job_type_split": dict(type_counts),
-            "avg_hourly_rate_min": round(sum(hourly_rates_min) / max(len(hourly_rates_min), 1), 2),
-            "avg_hourly_rate_max": round(sum(hourly_rates_max) / max(len(hourly_rates_max), 1), 2),
-            "avg_fixed_budget": round(sum(budget_amounts) / max(len(budget_amounts), 1), 2),
+
+async def _store_analysis(key: str, version: str, result: str):
+    """Persist an analysis result, ignoring failures since it's only a cache."""
+    try:
+        await (await _get_write_repo()).store_analysis(key, version, result)
+    except sqlite3.Error:
+        pass  # e.g. a scrape holds the write lock; the next call recomputes
+
+
+def _format_market_analysis(agg: dict, skill_focus: str) -> str | None:
+    """Render aggregate_market() output as the tool's JSON; None if no jobs."""
+    total = agg["total"]
+    if not total:
+        return None
+
+    # Top skills
+    top_skills = [
+        {"skill": skill, "count": count, "percentage": round(count / total * 100, 1)}
+        for skill, count in agg["top_skills"]
+    ]
+
+    # Budget distribution
+    budget_total = sum(agg["budget_buckets"])
+    budget_dist = [
+        {
+            "range": label,
+            "count": count,
+            "percentage": round(count / budget_total * 100, 1),
         }
+        for label, count in zip(_BUDGET_BUCKET_LABELS, agg["budget_buckets"])
+        if count > 0
+    ]
 
-        return json.dumps(analysis, indent=2)
+    type_counts = {}
+    if agg["hourly_count"]:
+        type_counts["hourly"] = agg["hourly_count"]
+    if agg["fixed_count"]:
+        type_counts["fixed"] = agg["fixed_count"]
+
+    analysis = {
+        "total_jobs_analyzed": total,
+        "skill_focus": skill_focus or "all",
+        "top_skills": top_skills,
+        "budget_distribution": budget_dist,
+        "experience_breakdown": agg["experience_breakdown"],
+        "job_type_split": type_counts,
+        "avg_hourly_rate_min": round(agg["avg_hourly_rate_min"], 2),
+        "avg_hourly_rate_max": round(agg["avg_hourly_rate_max"], 2),
+        "avg_fixed_budget": round(agg["avg_fixed_budget"], 2),
+    }
 
-    finally:
-        await db.close()
+    return dumps(analysis)
 
 
 async def suggest_portfolio_projects(
@@ -149,79 +157,167 @@ async def suggest_portfolio_projects(
         description, skills demonstrated, matching job count,
         sample job titles, estimated complexity, tech stack.
     """
-    db, repo = await _get_repo()
-    try:
-        my_skills = [s.strip().lower() for s in your_skills.split(",") if s.strip()]
+    my_skills = [s.strip().lower() for s in your_skills.split(",") if s.strip()]
 
-        if not my_skills:
-            return json.dumps({"error": "Please provide your skills as comma-separated values."})
+    if not my_skills:
+        return dumps({"error": "Please provide your skills as comma-separated values."})
 
-        # Get all jobs and find skill combinations
+    # Get all jobs and find skill combinations
+    async with _get_repo() as repo:
         all_jobs = await repo.query_jobs(limit=500)
 
-        if not all_jobs:
-            return json.dumps({
-                "error": "No cached jobs. Fetch jobs first to generate portfolio suggestions.",
-            })
+    if not all_jobs:
+        return dumps({
+            "error": "No cached jobs. Fetch jobs first to generate portfolio suggestions.",
+        })
+
+    # The combo counting and set work is CPU-bound; keep it off the event loop
+    suggestions = await asyncio.to_thread(_suggest_projects, all_jobs, my_skills, top_n)
+    return dumps(suggestions)
+
+
+def _suggest_projects(all_jobs: list[JobSummary], my_skills: list[str], top_n: int) -> list[dict]:
+    """Build up to ``top_n`` project suggestions from the cached jobs."""
+    my_skill_set = frozenset(my_skills)
+
+    # Find skill combos that appear together in jobs. Each job's skills are
+    # lowercased once here; matching_jobs keeps the set for the title lookup.
+    matching_jobs = []
+    combo_keys = []
+    # Bound methods hoisted out of the per-job loop
+    no_overlap = my_skill_set.isdisjoint
+    add_match = matching_jobs.append
+    add_combo = combo_keys.append
+
+    for job in all_jobs:
+        job_skills_lower = [s.lower() for s in job.skills]
+        job_skill_set = frozenset(job_skills_lower)
+        # Skip jobs with no overlap with user skills
+        if no_overlap(job_skill_set):
+            continue
+        add_match((job, job_skill_set))
+        # Track non-overlap skills (gaps = learning opportunities); the combo
+        # is the first 8 skills, i.e. the job's own set when it has no more
+        add_combo(job_skill_set if len(job_skills_lower) <= 8 else frozenset(job_skills_lower[:8]))
+
+    # Counted in one C-level pass; ties keep first-seen order as before
+    skill_combos = Counter(combo_keys)
+
+    # Skill -> positions in matching_jobs (ascending), for the sample titles
+    skill_to_jobs: dict[str, list[int]] = {}
+    for pos, (_, job_skill_set) in enumerate(matching_jobs):
+        for skill in job_skill_set & my_skill_set:
+            skill_to_jobs.setdefault(skill, []).append(pos)
+
+    # Identify top demanded skill combinations that match user skills
+    top_combos = skill_combos.most_common(top_n * 2)
+
+    suggestions = []
+    seen_themes = set()
+
+    for combo, count in top_combos:
+        if len(suggestions) >= top_n:
+            break
+
+        combo_list = sorted(combo)
+        my_match = my_skill_set & combo
+        new_skills = combo - my_skill_set
+
+        # Create a theme based on the skill combination
+        theme = _generate_project_theme(list(my_match), list(new_skills))
+        if theme["name"] in seen_themes:
+            continue
+        seen_themes.add(theme["name"])
+
+        # First 3 matching jobs sharing a skill with this combo, in job order
+        sample_titles = []
+        last_pos = -1
+        for pos in heapq.merge(*(skill_to_jobs.get(skill, ()) for skill in my_match)):
+            if pos != last_pos:
+                last_pos = pos
+                sample_titles.append(matching_jobs[pos][0].title)
+                if len(sample_titles) >= 3:
+                    break
+
+        suggestions.append({
+            "project_name": theme["name"],
+            "description": theme["description"],
+            "skills_demonstrated": list(my_match | (new_skills & set(combo_list[:3]))),
+            "matching_jobs_count": count,
+            "sample_job_titles": sample_titles,
+            "estimated_complexity": theme["complexity"],
+            "github_repo_idea": theme["repo"],
+            "tech_stack": combo_list[:6],
+        })
+
+    return suggestions
+
+
+# Project templates based on common skill patterns
+_PROJECT_TEMPLATES = (
+    {
+        "triggers": {"react", "next", "nextjs", "typescript", "tailwind"},
+        "name": "Full-Stack Dashboard",
+        "description": "Interactive analytics dashboard with real-time data visualization, auth, and responsive design. Demonstrates frontend mastery with modern frameworks.",
+        "complexity": "week",
+        "repo": "analytics-dashboard",
+    },
+    {
+        "triggers": {"python", "fastapi", "django", "flask", "api"},
+        "name": "REST API with Auth & Docs",
+        "description": "Production-ready REST API with JWT auth, rate limiting, auto-generated OpenAPI docs, database migrations, and comprehensive tests.",
+        "complexity": "week",
+        "repo": "production-api-template",
+    },
+    {
+        "triggers": {"python", "ai", "machine learning", "openai", "llm", "gpt"},
+        "name": "AI-Powered Tool",
+        "description": "SaaS tool that uses LLM APIs for intelligent text processing (summarization, extraction, or classification) with a clean UI and usage tracking.",
+        "complexity": "week",
+        "repo": "ai-text-toolkit",
+    },
+    {
+        "triggers": {"node", "express", "mongodb", "postgresql", "database"},
+        "name": "Multi-tenant SaaS Starter",
+        "description": "Backend for a multi-tenant SaaS app with user management, billing stubs, role-based access control, and API documentation.",
+        "complexity": "month",
+        "repo": "saas-backend-starter",
+    },
+    {
+        "triggers": {"react native", "flutter", "mobile", "ios", "android"},
+        "name": "Cross-Platform Mobile App",
+        "description": "Mobile app with offline-first architecture, push notifications, and cloud sync. Demonstrates mobile development best practices.",
+        "complexity": "month",
+        "repo": "mobile-app-starter",
+    },
+    {
+        "triggers": {"automation", "scraping", "selenium", "playwright", "bot"},
+        "name": "Web Automation Framework",
+        "description": "Extensible web automation tool with anti-detection, scheduling, data extraction, and export capabilities. Shows automation expertise.",
+        "complexity": "week",
+        "repo": "smart-automation-framework",
+    },
+    {
+        "triggers": {"aws", "cloud", "docker", "kubernetes", "devops", "terraform"},
+        "name": "Infrastructure as Code Template",
+        "description": "Complete IaC setup with CI/CD pipelines, monitoring, and auto-scaling. Demonstrates DevOps and cloud architecture skills.",
+        "complexity": "week",
+        "repo": "cloud-infra-template",
+    },
+)
+
 
-        # Find skill combos that appear together in jobs
-        skill_combos = Counter()
-        matching_jobs = []
-
-        for job in all_jobs:
-            job_skills_lower = [s.lower() for s in job.skills]
-            # Check overlap with user skills
-            overlap = set(my_skills) & set(job_skills_lower)
-            if overlap:
-                matching_jobs.append(job)
-                # Track non-overlap skills (gaps = learning opportunities)
-                combo_key = frozenset(job_skills_lower[:8])
-                skill_combos[combo_key] += 1
-
-        # Identify top demanded skill combinations that match user skills
-        top_combos = skill_combos.most_common(top_n * 2)
-
-        suggestions = []
-        seen_themes = set()
-
-        for combo, count in top_combos:
-            if len(suggestions) >= top_n:
-                break
-
-            combo_list = sorted(combo)
-            my_match = set(my_skills) & combo
-            new_skills = combo - set(my_skills)
-
-            # Create a theme based on the skill combination
-            theme = _generate_project_theme(list(my_match), list(new_skills))
-            if theme["name"] in seen_themes:
-                continue
-            seen_themes.add(theme["name"])
-
-            # Find matching job titles for this combo
-            sample_titles = []
-            for job in matching_jobs:
-                job_skills_lower = {s.lower() for s in job.skills}
-                if my_match & job_skills_lower:
-                    sample_titles.append(job.title)
-                    if len(sample_titles) >= 3:
-                        break
-
-            suggestions.append({
-                "project_name": theme["name"],
-                "description": theme["description"],
-                "skills_demonstrated": list(my_match | (new_skills & set(combo_list[:3]))),
-                "matching_jobs_count": count,
-                "sample_job_titles": sample_titles,
-                "estimated_complexity": theme["complexity"],
-                "github_repo_idea": theme["repo"],
-                "tech_stack": combo_list[:6],
-            })
 
-        return json.dumps(suggestions, indent=2)
+def _build_trigger_index() -> dict[str, list[int]]:
+    """Map each trigger skill to the indexes of the templates it scores for."""
+    index: dict[str, list[int]] = {}
+    for i, template in enumerate(_PROJECT_TEMPLATES):
+        for trigger in template["triggers"]:
+            index.setdefault(trigger, []).append(i)
+    return index
 
-    finally:
-        await db.close()
+
+_TRIGGER_INDEX = _build_trigger_index()
 
 
 def _generate_project_theme(
@@ -230,71 +326,14 @@ def _generate_project_theme(
     """Generate a project theme based on skill overlap and gaps."""
     all_skills = set(s.lower() for s in my_skills + gap_skills)
 
-    # Project templates based on common skill patterns
-    templates = [
-        {
-            "triggers": {"react", "next", "nextjs", "typescript", "tailwind"},
-            "name": "Full-Stack Dashboard",
-            "description": "Interactive analytics dashboard with real-time data visualization, auth, and responsive design. Demonstrates frontend mastery with modern frameworks.",
-            "complexity": "week",
-            "repo": "analytics-dashboard",
-        },
-        {
-            "triggers": {"python", "fastapi", "django", "flask", "api"},
-            "name": "REST API with Auth & Docs",
-            "description": "Production-ready REST API with JWT auth, rate limiting, auto-generated OpenAPI docs, database migrations, and comprehensive tests.",
-            "complexity": "week",
-            "repo": "production-api-template",
-        },
-        {
-            "triggers": {"python", "ai", "machine learning", "openai", "llm", "gpt"},
-            "name": "AI-Powered Tool",
-            "description": "SaaS tool that uses LLM APIs for intelligent text processing (summarization, extraction, or classification) with a clean UI and usage tracking.",
-            "complexity": "week",
-            "repo": "ai-text-toolkit",
-        },
-        {
-            "triggers": {"node", "express", "mongodb", "postgresql", "database"},
-            "name": "Multi-tenant SaaS Starter",
-            "description": "Backend for a multi-tenant SaaS app with user management, billing stubs, role-based access control, and API documentation.",
-            "complexity": "month",
-            "repo": "saas-backend-starter",
-        },
-        {
-            "triggers": {"react native", "flutter", "mobile", "ios", "android"},
-            "name": "Cross-Platform Mobile App",
-            "description": "Mobile app with offline-first architecture, push notifications, and cloud sync. Demonstrates mobile development best practices.",
-            "complexity": "month",
-            "repo": "mobile-app-starter",
-        },
-        {
-            "triggers": {"automation", "scraping", "selenium", "playwright", "bot"},
-            "name": "Web Automation Framework",
-            "description": "Extensible web automation tool with anti-detection, scheduling, data extraction, and export capabilities. Shows automation expertise.",
-            "complexity": "week",
-            "repo": "smart-automation-framework",
-        },
-        {
-            "triggers": {"aws", "cloud", "docker", "kubernetes", "devops", "terraform"},
-            "name": "Infrastructure as Code Template",
-            "description": "Complete IaC setup with CI/CD pipelines, monitoring, and auto-scaling. Demonstrates DevOps and cloud architecture skills.",
-            "complexity": "week",
-            "repo": "cloud-infra-template",
-        },
-    ]
-
-    # Find best matching template
-    best_match = None
-    best_score = 0
-
-    for template in templates:
-        score = len(all_skills & template["triggers"])
-        if score > best_score:
-            best_score = score
-            best_match = template
-
-    if best_match:
-        return best_match
+    # Score templates by trigger hits; the first one with the top score wins
+    scores = [0] * len(_PROJECT_TEMPLATES)
+    for skill in all_skills:
+        for i in _TRIGGER_INDEX.get(skill, ()):
+            scores[i] += 1
+    best_score = max(scores)
+    if best_score:
+        return _PROJECT_TEMPLATES[scores.index(best_score)]
 
     # Generic fallback
     skill_str = ", ".join(my_skills[:3])
@@ -2,21 +2,9 @@
 
 from __future__ import annotations
 
-import json
-
-import aiosqlite
-
-from ..config import DB_PATH
-from ..database.models import initialize_db
-from ..database.repository import JobRepository
-
-
-async def _get_repo() -> tuple[aiosqlite.Connection, JobRepository]:
-    """Get a database connection and repository."""
-    db = await aiosqlite.connect(str(DB_PATH))
-    db.row_factory = aiosqlite.Row
-    await initialize_db(db)
-    return db, JobRepository(db)
+from ._db import _get_repo
+from ._format import format_budget, format_job_entry
+from ._json import dumps
 
 
 async def list_cached_jobs(
@@ -40,15 +28,14 @@ async def list_cached_jobs(
             (e.g. "python,fastapi"). Matches if job has ANY listed skill.
         min_budget: Minimum budget filter in USD.
         experience_level: "entry", "intermediate", "expert", or "".
-        posted_within_hours: Only jobs fetched within N hours (0=all).
+        posted_within_hours: Only jobs posted within N hours (0=all).
         sort_by: "posted_date", "budget", or "fetched_at" (default).
         limit: Max results to return (default 25).
 
     Returns:
         JSON list of job summaries from local cache.
     """
-    db, repo = await _get_repo()
-    try:
+    async with _get_repo() as repo:
         jobs = await repo.query_jobs(
             source=source,
             skills_contain=skills_contain,
@@ -59,30 +46,22 @@ async def list_cached_jobs(
             limit=limit,
         )
 
-        if not jobs:
-            return "No cached jobs found matching your filters. Try fetching jobs first."
-
-        lines = [f"Found {len(jobs)} cached jobs:\n"]
-        for i, job in enumerate(jobs, 1):
-            budget = ""
-            if job.budget_amount:
-                budget = f"${job.budget_amount:,.0f}"
-            elif job.hourly_rate_min:
-                budget = f"${job.hourly_rate_min}-${job.hourly_rate_max or '?'}/hr"
+    if not jobs:
+        return "No cached jobs found matching your filters. Try fetching jobs first."
 
-            skills = ", ".join(job.skills[:5])
-            lines.append(
-                f"{i}. **{job.title}**\n"
-                f"   Budget: {budget or 'N/A'} | "
-                f"Level: {job.experience_level or 'N/A'} | "
-                f"Source: {job.source}\n"
-                f"   Skills: {skills or 'None'}\n"
-                f"   URL: {job.url}\n"
-            )
+    lines = [f"Found {len(jobs)} cached jobs:\n"]
+    for i, job in enumerate(jobs, 1):
+        lines.append(format_job_entry(
+            i,
+            job.title,
+            format_budget(job.budget_amount, job.hourly_rate_min, job.hourly_rate_max),
+            job.experience_level,
+            f"Source: {job.source}",
+            job.skills,
+            job.url,
+        ))
 
-        return "\n".join(lines)
-    finally:
-        await db.close()
+    return "\n".join(lines)
 
 
 async def get_scraping_stats() -> str:
@@ -94,9 +73,6 @@ async def get_scraping_stats() -> str:
     Returns:
         JSON with database statistics.
     """
-    db, repo = await _get_repo()
-    try:
+    async with _get_repo() as repo:
         stats = await repo.get_stats()
-        return json.dumps(stats, indent=2)
-    finally:
-        await db.close()
+    return dumps(stats)
@@ -2,12 +2,31 @@
 
 from __future__ import annotations
 
-import json
-
 from ..config import SESSION_MANAGER_URL
+from ._format import format_budget, format_job_entry
+from ._json import dumps
 from .session_tools import _call_session_manager
 
 
+def _format_scraped_jobs(header: str, jobs: list[dict]) -> str:
+    """Render Session Manager job summaries as a numbered Markdown list."""
+    lines = [header]
+    for i, job in enumerate(jobs, 1):
+        proposals = job.get("proposals_count")
+        lines.append(format_job_entry(
+            i,
+            job.get("title") or "Untitled",
+            format_budget(job.get("budget_amount"), job.get("hourly_rate_min"), job.get("hourly_rate_max")),
+            job.get("experience_level", ""),
+            f"Proposals: {'N/A' if proposals is None else proposals}",
+            job.get("skills", []),
+            job.get("url", ""),
+            missing="Not specified",
+            no_skills="None listed",
+        ))
+    return "\n".join(lines)
+
+
 async def fetch_best_matches(max_jobs: int = 20, force_refresh: bool = False) -> str:
     """Fetch your personalized 'Best Matches' from Upwork.
 
@@ -38,25 +57,7 @@ async def fetch_best_matches(max_jobs: int = 20, force_refresh: bool = False) ->
         return "No Best Matches found. Make sure your Upwork profile is complete."
 
     # Format for readable output
-    lines = [f"Found {count} Best Matches:\n"]
-    for i, job in enumerate(jobs, 1):
-        budget = ""
-        if job.get("budget_amount"):
-            budget = f"${job['budget_amount']:,.0f}"
-        elif job.get("hourly_rate_min"):
-            budget = f"${job['hourly_rate_min']}-${job.get('hourly_rate_max', '?')}/hr"
-
-        skills = ", ".join(job.get("skills", [])[:5])
-        lines.append(
-            f"{i}. **{job.get('title', 'Untitled')}**\n"
-            f"   Budget: {budget or 'Not specified'} | "
-            f"Level: {job.get('experience_level', 'N/A')} | "
-            f"Proposals: {job.get('proposals_count', 'N/A')}\n"
-            f"   Skills: {skills or 'None listed'}\n"
-            f"   URL: {job.get('url', '')}\n"
-        )
-
-    return "\n".join(lines)
+    return _format_scraped_jobs(f"Found {count} Best Matches:\n", jobs)
 
 
 async def search_jobs(
@@ -121,25 +122,7 @@ async def search_jobs(
     if count == 0:
         return f"No jobs found for query: '{query}'"
 
-    lines = [f"Found {count} jobs for '{query}':\n"]
-    for i, job in enumerate(jobs, 1):
-        budget = ""
-        if job.get("budget_amount"):
-            budget = f"${job['budget_amount']:,.0f}"
-        elif job.get("hourly_rate_min"):
-            budget = f"${job['hourly_rate_min']}-${job.get('hourly_rate_max', '?')}/hr"
-
-        skills = ", ".join(job.get("skills", [])[:5])
-        lines.append(
-            f"{i}. **{job.get('title', 'Untitled')}**\n"
-            f"   Budget: {budget or 'Not specified'} | "
-            f"Level: {job.get('experience_level', 'N/A')} | "
-            f"Proposals: {job.get('proposals_count', 'N/A')}\n"
-            f"   Skills: {skills or 'None listed'}\n"
-            f"   URL: {job.get('url', '')}\n"
-        )
-
-    return "\n".join(lines)
+    return _format_scraped_jobs(f"Found {count} jobs for '{query}':\n", jobs)
 
 
 async def get_job_details(job_url: str) -> str:
@@ -164,4 +147,29 @@ async def get_job_details(job_url: str) -> str:
         return f"Error: {result['error']}"
 
     job = result.get("job", {})
-    return json.dumps(job, indent=2)
+    return dumps(job)
+
+
+async def fetch_job_details_batch(job_urls: list[str]) -> str:
+    """Fetch complete details for several Upwork job postings in one call.
+
+    The Session Manager visits the jobs one after another on a single
+    browser tab, so this is cheaper than calling get_job_details per job.
+
+    Args:
+        job_urls: Full Upwork job URLs or job IDs (the ~0xxxxx part), at
+            most 20.
+
+    Returns:
+        JSON with the fetched jobs (all fields) and any per-URL errors.
+    """
+    result = await _call_session_manager(
+        "POST",
+        "/scrape/job-detail-batch",
+        {"job_urls": job_urls},
+    )
+
+    if "error" in result:
+        return f"Error: {result['error']}"
+
+    return dumps({"jobs": result.get("jobs", []), "errors": result.get("errors", [])})
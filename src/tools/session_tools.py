@@ -2,25 +2,85 @@
 
 from __future__ import annotations
 
+import os
+
 import httpx
+import orjson
+
+from ..config import SESSION_MANAGER_SOCKET, SESSION_MANAGER_URL
+from ._json import dumps
+
+# Shared keep-alive client for all Session Manager calls; created on first use
+_client: httpx.AsyncClient | None = None
+_client_on_socket = False
+_use_socket = bool(SESSION_MANAGER_SOCKET)
+
+# Keep idle connections for a minute (httpx's default is 5s) so tool calls a
+# few seconds apart reuse one; aiohttp drops idle keep-alives after 75s
+_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client, (re)creating it if needed.
+
+    Talks over the Session Manager's unix socket when it exists, else TCP.
+    """
+    global _client, _client_on_socket
+    if _client is None or _client.is_closed:
+        _client_on_socket = _use_socket and os.path.exists(SESSION_MANAGER_SOCKET)
+        # httpx ignores the client's limits= when given a transport, so the
+        # socket transport needs them itself
+        transport = (
+            httpx.AsyncHTTPTransport(uds=SESSION_MANAGER_SOCKET, limits=_LIMITS)
+            if _client_on_socket
+            else None
+        )
+        _client = httpx.AsyncClient(
+            base_url=SESSION_MANAGER_URL, timeout=120.0, limits=_LIMITS, transport=transport
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared Session Manager client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
-from ..config import SESSION_MANAGER_URL
+
+async def _send(method: str, path: str, json_body: dict | None) -> httpx.Response:
+    """Send one request, retrying over TCP if the unix socket is dead."""
+    global _use_socket
+    client = _get_client()
+    try:
+        if method == "GET":
+            return await client.get(path)
+        return await client.post(path, json=json_body or {})
+    except httpx.ConnectError:
+        if not _client_on_socket:
+            raise
+        # Stale socket left by a crashed run; fall back to TCP from now on
+        _use_socket = False
+        await close_client()
+        return await _send(method, path, json_body)
 
 
 async def _call_session_manager(method: str, path: str, json_body: dict | None = None) -> dict:
     """Make a request to the session manager HTTP service."""
-    url = f"{SESSION_MANAGER_URL}{path}"
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            if method == "GET":
-                resp = await client.get(url)
-            else:
-                resp = await client.post(url, json=json_body or {})
-
-            if resp.status_code >= 400:
-                data = resp.json()
-                return {"error": data.get("error", f"HTTP {resp.status_code}")}
-            return resp.json()
+        resp = await _send(method, path, json_body)
+
+        # Decode with orjson straight from the body bytes (resp.json() uses stdlib json)
+        if resp.status_code >= 400:
+            try:
+                data = orjson.loads(resp.content)
+            except orjson.JSONDecodeError:
+                # Not one of our JSON error bodies (e.g. a proxy error page)
+                text = resp.content[:200].decode(errors="replace")
+                return {"error": f"HTTP {resp.status_code}: {text}"}
+            return {"error": data.get("error", f"HTTP {resp.status_code}")}
+        return orjson.loads(resp.content)
 
     except httpx.ConnectError:
         return {
@@ -87,8 +147,7 @@ async def session_status() -> str:
     if "error" in result:
         return f"Error: {result['error']}"
 
-    import json
-    return json.dumps(result, indent=2)
+    return dumps(result, pretty=True)
 
 
 async def check_auth() -> str:
@@ -0,0 +1,93 @@
+"""Tests for the persisted analyze_market_requirements cache."""
+
+import asyncio
+import sqlite3
+
+import aiosqlite
+import orjson
+import pytest
+import pytest_asyncio
+
+import src.database.connection as connection
+import src.tools._db as tools_db
+import src.tools.analysis_tools as analysis_tools
+from src.database.repository import JobRepository
+from src.models.job import Job
+
+
+def _job(i: int) -> Job:
+    return Job(
+        id=f"~0{i}",
+        url=f"https://www.upwork.com/jobs/~0{i}",
+        title=f"Job {i}",
+        skills=["Python", "FastAPI"],
+        source="search",
+        budget_amount=250.0 * i,
+    )
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(connection, "DB_PATH", tmp_path / "jobs.db")
+    monkeypatch.setattr(connection, "_schema_ready", False)
+    monkeypatch.setattr(tools_db, "_repos", {})
+    analysis_tools._ANALYSIS_CACHE.clear()
+    db = await connection.get_db()
+    await JobRepository(db).upsert_jobs([_job(i) for i in range(1, 4)])
+    yield db
+    await asyncio.gather(*analysis_tools._pending_writes)
+    analysis_tools._ANALYSIS_CACHE.clear()
+    await connection.close_db()
+
+
+async def _analyze() -> str:
+    result = await analysis_tools.analyze_market_requirements()
+    await asyncio.gather(*analysis_tools._pending_writes)
+    return result
+
+
+async def _stored_versions(db: aiosqlite.Connection) -> list[str]:
+    return [row[0] for row in await db.execute_fetchall("SELECT version FROM analysis_cache")]
+
+
+@pytest.mark.asyncio
+async def test_persisted_result_is_reused(db, monkeypatch):
+    first = await _analyze()
+    assert orjson.loads(first)["total_jobs_analyzed"] == 3
+    assert len(await _stored_versions(db)) == 1
+
+    # As after a restart: nothing in memory, so the table must serve it
+    analysis_tools._ANALYSIS_CACHE.clear()
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("recomputed despite a stored result")
+
+    monkeypatch.setattr(JobRepository, "aggregate_market", fail)
+    assert await _analyze() == first
+
+
+@pytest.mark.asyncio
+async def test_new_jobs_invalidate_stored_result(db):
+    await _analyze()
+    (old_version,) = await _stored_versions(db)
+
+    await JobRepository(db).upsert_jobs([_job(4)])
+    analysis_tools._ANALYSIS_CACHE.clear()
+
+    assert orjson.loads(await _analyze())["total_jobs_analyzed"] == 4
+    (new_version,) = await _stored_versions(db)
+    assert new_version != old_version
+
+
+@pytest.mark.asyncio
+async def test_store_failure_leaves_no_open_transaction(db, tmp_path):
+    await db.execute("PRAGMA busy_timeout=0")
+    async with aiosqlite.connect(tmp_path / "jobs.db") as other:
+        await other.execute("BEGIN IMMEDIATE")
+        with pytest.raises(sqlite3.OperationalError):
+            await JobRepository(db).store_analysis("k", "v", "{}")
+        assert not db.in_transaction
+        await other.rollback()
+
+    await JobRepository(db).store_analysis("k", "v", "{}")
+    assert await _stored_versions(db) == ["v"]
@@ -0,0 +1,81 @@
+"""Tests for posted-time resolution and the posted_at migration."""
+
+from datetime import datetime, timezone
+
+import aiosqlite
+import pytest
+
+from src.database.models import initialize_db
+from src.database.repository import JobRepository
+from src.models.job import Job, posted_timestamp
+
+FETCHED = "2026-01-02T12:00:00+00:00"
+FETCHED_TS = int(datetime(2026, 1, 2, 12, tzinfo=timezone.utc).timestamp())
+
+
+@pytest.mark.parametrize(
+    "posted_date, expected",
+    [
+        ("2026-01-01T08:30:00+00:00", int(datetime(2026, 1, 1, 8, 30, tzinfo=timezone.utc).timestamp())),
+        ("Posted 3 hours ago", FETCHED_TS - 3 * 3600),
+        ("an hour ago", FETCHED_TS - 3600),
+        ("yesterday", FETCHED_TS - 86400),
+        ("last quarter-ish", FETCHED_TS),
+        ("", FETCHED_TS),
+    ],
+)
+def test_posted_timestamp(posted_date, expected):
+    assert posted_timestamp(posted_date, FETCHED) == expected
+
+
+def test_posted_timestamp_without_fetched_at():
+    assert posted_timestamp("2 days ago", "") is None
+
+
+async def _posted_at(db: aiosqlite.Connection) -> dict[str, int | None]:
+    return dict(await db.execute_fetchall("SELECT id, posted_at FROM jobs"))
+
+
+async def _seed(db: aiosqlite.Connection):
+    await initialize_db(db)
+    await JobRepository(db).upsert_jobs([
+        Job(id="~01", url="https://www.upwork.com/jobs/~01", title="a",
+            posted_date="5 hours ago", fetched_at=FETCHED),
+        Job(id="~02", url="https://www.upwork.com/jobs/~02", title="b",
+            posted_date="yesterday", fetched_at=FETCHED),
+    ])
+
+
+@pytest.mark.asyncio
+async def test_migration_adds_and_backfills_posted_at():
+    async with aiosqlite.connect(":memory:") as db:
+        await _seed(db)
+        expected = await _posted_at(db)
+        # Recreate a database from before posted_at existed
+        await db.executescript(
+            "DROP INDEX idx_jobs_posted_at;"
+            "DROP INDEX idx_jobs_source_posted_at;"
+            "ALTER TABLE jobs DROP COLUMN posted_at;"
+        )
+
+        await initialize_db(db)
+
+        assert await _posted_at(db) == expected == {
+            "~01": FETCHED_TS - 5 * 3600,
+            "~02": FETCHED_TS - 86400,
+        }
+        assert not db.in_transaction
+
+
+@pytest.mark.asyncio
+async def test_migration_backfills_rows_left_null():
+    async with aiosqlite.connect(":memory:") as db:
+        await _seed(db)
+        expected = await _posted_at(db)
+        # A run that added the column but died before its backfill
+        await db.execute("UPDATE jobs SET posted_at = NULL")
+        await db.commit()
+
+        await initialize_db(db)
+
+        assert await _posted_at(db) == expected
@@ -0,0 +1,62 @@
+"""Tests for JobRepository skill filtering."""
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from src.database.models import initialize_db
+from src.database.repository import JobRepository
+from src.models.job import Job
+
+SKILL_SETS = [
+    ["C++", "Qt"],
+    ["C#", ".NET"],
+    ["CSS", "HTML"],
+    ["Cloud Computing"],
+    ["Node.js", "Express"],
+    ["Python"],
+]
+
+
+@pytest_asyncio.fixture
+async def repo():
+    async with aiosqlite.connect(":memory:") as db:
+        await initialize_db(db)
+        repo = JobRepository(db)
+        await repo.upsert_jobs([
+            Job(
+                id=f"~0{i}",
+                url=f"https://www.upwork.com/jobs/~0{i}",
+                title=f"Job {i}",
+                skills=skills,
+                source="search",
+            )
+            for i, skills in enumerate(SKILL_SETS)
+        ])
+        yield repo
+
+
+async def _titles(repo: JobRepository, skills_contain: str) -> set[str]:
+    return {job.title for job in await repo.query_jobs(skills_contain=skills_contain)}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "skills_contain, expected",
+    [
+        ("c++", {"Job 0"}),
+        ("C#", {"Job 1"}),
+        (".net", {"Job 1"}),
+        ("node.js", {"Job 4"}),
+        ("c++,css", {"Job 0", "Job 2"}),
+        ("python", {"Job 5"}),
+    ],
+)
+async def test_punctuated_skills_match_exactly(repo, skills_contain, expected):
+    assert await _titles(repo, skills_contain) == expected
+
+
+@pytest.mark.asyncio
+async def test_aggregate_market_matches_punctuated_skills(repo):
+    agg = await repo.aggregate_market(skills_contain="c#")
+    assert agg["total"] == 1